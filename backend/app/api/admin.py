@@ -3,6 +3,7 @@ Jan-Seva AI - Admin API Router (API-Only)
 Admin tools: system health, analytics, and operational helpers.
 """
 
+import re
 from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Query
@@ -38,24 +39,68 @@ def _first_available_count(client: Any, table_names: list[str], default: int = 0
     return default
 
 
+# Flipped off once a full-text query reports the search_tsv column missing,
+# so later searches go straight to ILIKE instead of failing first every time
+_fts_available = True
+
+
+def _is_missing_column(exc: Exception) -> bool:
+    """Postgres undefined_column (42703), as raised through PostgREST."""
+    message = str(exc).lower()
+    return getattr(exc, "code", None) == "42703" or (
+        "column" in message and "does not exist" in message
+    )
+
+
+def _prefix_tsquery(search: str) -> str:
+    """'pm kis' -> 'pm:* & kis:*' — every word must match as a prefix."""
+    return " & ".join(f"{term}:*" for term in re.findall(r"\w+", search))
+
+
 def _fetch_admin_schemes(
     client: Any,
     page: int,
     limit: int,
     search: Optional[str],
 ) -> Tuple[list[Dict[str, Any]], int]:
+    global _fts_available
     start = (page - 1) * limit
     end = start + limit - 1
 
-    query = client.table("schemes").select(
-        "id, name, ministry, state, category, updated_at",
-        count="exact",
-    )
-
-    if search:
-        query = query.ilike("name", f"%{search}%")
+    def run(tsquery: Optional[str] = None):
+        query = client.table("schemes").select(
+            "id, name, ministry, state, category, updated_at",
+            count="exact",
+        )
+        if tsquery:
+            query = query.filter("search_tsv", "fts(english)", tsquery)
+        elif search:
+            query = query.ilike("name", f"%{search}%")
+        return query.order("updated_at", desc=True).range(start, end).execute()
+
+    # search_tsv is a stored, GIN-indexed full-text column over name/description/benefits:
+    #   ALTER TABLE schemes ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
+    #     setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    #     setweight(to_tsvector('english', coalesce(description, '') || ' ' || coalesce(benefits, '')), 'B')
+    #   ) STORED;
+    #   CREATE INDEX schemes_tsv_idx ON schemes USING GIN (search_tsv);
+    # Words match as prefixes ("kis" finds "PM-Kisan"); when that finds nothing
+    # (e.g. a fragment from mid-word) or the column is missing, fall back to a
+    # name ILIKE scan.
+    tsquery = _prefix_tsquery(search) if search and _fts_available else ""
+    if tsquery:
+        try:
+            response = run(tsquery)
+            if response.count or response.data:
+                return response.data or [], int(response.count or 0)
+        except Exception as exc:
+            # Only a missing column is permanent; timeouts / 5xx fall back for
+            # this request alone
+            if _is_missing_column(exc):
+                _fts_available = False
+            logger.warning(f"Full-text scheme search unavailable, using ILIKE: {exc}")
 
-    response = query.order("updated_at", desc=True).range(start, end).execute()
+    response = run()
     return response.data or [], int(response.count or 0)
 
 
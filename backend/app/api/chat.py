@@ -9,11 +9,10 @@ Handles text and audio chat with:
 """
 
 from fastapi import APIRouter, Request, UploadFile, File, Form, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from app.models.chat import ChatTextRequest, ChatResponse
 from app.services.api_aggregator import get_api_aggregator
 from app.utils.logger import logger
-import os
 import traceback
 
 router = APIRouter()
@@ -66,7 +65,7 @@ async def chat_text(chat_request: ChatTextRequest, request: Request):
             location_svc = get_location_service()
             state_info = await location_svc.get_state_from_ip(client_ip)
             if state_info:
-                set_state_from_ip(session_id, state_info)
+                await set_state_from_ip(session_id, state_info)
                 resolved_state = state_info
                 logger.info(f"📍 Session {session_id}: state = {state_info['name']}")
         except Exception as e:
@@ -83,7 +82,7 @@ async def chat_text(chat_request: ChatTextRequest, request: Request):
         )
 
     # ── 2. Block Status Check ─────────────────────────────────────────────────
-    blocked, remaining = is_blocked(session_id)
+    blocked, remaining = await is_blocked(session_id)
     if blocked:
         return ChatResponse(
             reply=get_block_message(remaining),
@@ -92,7 +91,7 @@ async def chat_text(chat_request: ChatTextRequest, request: Request):
 
     # ── 3. Off-Topic Warning ──────────────────────────────────────────────────
     if verdict == TopicVerdict.WARN:
-        warn_num, now_blocked = issue_warning(session_id)
+        warn_num, now_blocked = await issue_warning(session_id)
         if now_blocked:
             return ChatResponse(
                 reply=get_block_message(3600),
@@ -181,12 +180,28 @@ async def chat_audio(
             audio_bytes=audio_bytes,
             user_id=user_id,
             language=language,
+            synthesize=False,
         )
 
-        audio_path = result.get("audio_url")
-        if audio_path and os.path.exists(audio_path):
-            return FileResponse(
-                audio_path,
+        # Stream TTS straight to the client; pull the first chunk here so an
+        # Edge-TTS failure still falls back to the text reply below
+        from app.services.voice_service import get_voice_service
+        voice = get_voice_service()
+        stream = voice.synthesize_stream(result["answer"], language=result.get("language", "en"), slow=slow)
+        try:
+            first_chunk = await anext(stream)
+        except Exception as tts_err:
+            logger.error(f"❌ Edge-TTS failed: {tts_err}")
+            first_chunk = None
+
+        if first_chunk is not None:
+            async def audio_body():
+                yield first_chunk
+                async for chunk in stream:
+                    yield chunk
+
+            return StreamingResponse(
+                audio_body(),
                 media_type="audio/mpeg",
                 headers={
                     "X-Reply-Text": result.get("answer", "")[:500],
@@ -67,6 +67,9 @@ class Settings(BaseSettings):
     research_cache_ttl_minutes: int = 180
     research_cache_path: str = "data/research_cache.sqlite3"
 
+    # --- Session Store ---
+    redis_url: str = ""              # Empty = in-process sessions (single worker, lost on restart)
+
     # --- Wikipedia API ---
     wikipedia_client_id: str = ""
     wikipedia_client_secret: str = ""
@@ -79,6 +82,12 @@ class Settings(BaseSettings):
     bhashini_user_id: str = ""
     bhashini_api_key: str = ""
 
+    # --- Translation (IndicTrans2) ---
+    translation_ct2_dir: str = ""    # CTranslate2 int8 models in <dir>/en-indic and <dir>/indic-en
+    indic_beam_size: int = 3         # Beam width; 3 with early stopping ≈ quality of 5 at lower cost
+    translation_torchscript: bool = False  # TorchScript-trace the encoder (HF path; verified at load)
+    translation_dtype: str = "float32"     # "float16"/"bfloat16": cast on CUDA; bfloat16 autocast on CPU
+
     # --- WhatsApp ---
     whatsapp_verify_token: str = ""
     whatsapp_access_token: str = ""
@@ -88,6 +97,17 @@ class Settings(BaseSettings):
     supabase_url: str = ""
     supabase_anon_key: str = ""
     supabase_service_role_key: str = ""
+    supabase_db_url: str = ""        # Direct Postgres DSN — enables COPY bulk seeding
+    # Store embeddings at float16 precision. Pair with a halfvec column:
+    #   ALTER TABLE scheme_embeddings ALTER COLUMN embedding TYPE halfvec(384)
+    #     USING embedding::halfvec(384);
+    #   CREATE INDEX ON scheme_embeddings USING hnsw (embedding halfvec_cosine_ops);
+    embedding_half_precision: bool = False
+
+    # --- Embedding model runtime ---
+    embedding_backend: str = "torch"                  # "torch" or "onnx" (needs onnxruntime)
+    embedding_onnx_file: str = "onnx/model_O3.onnx"   # O3 = fused attention/LayerNorm graph
+    embedding_onnx_int8: bool = False                 # int8 dynamic-quantized weights (~4x smaller)
 
     # --- Derived ---
     @property
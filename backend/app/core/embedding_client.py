@@ -4,9 +4,28 @@ Uses sentence-transformers (all-MiniLM-L6-v2) for free, local embedding generati
 384-dimensional vectors for pgvector storage.
 """
 
+import os
+import threading
+
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
+from app.config import get_settings
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+# Dynamically quantized (int8 MatMul weights, VNNI kernels) export in the model repo
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+def embedding_model_id(model_name: str = DEFAULT_MODEL) -> str:
+    """Identifies the model + runtime that produced an embedding (for cache invalidation)."""
+    settings = get_settings()
+    if settings.embedding_backend != "onnx":
+        return f"{model_name}:torch"
+    file_name = ONNX_INT8_FILE if settings.embedding_onnx_int8 else settings.embedding_onnx_file
+    return f"{model_name}:onnx:{file_name}"
+
 
 class EmbeddingClient:
     """
@@ -14,10 +33,29 @@ class EmbeddingClient:
     Model: all-MiniLM-L6-v2 (384 dimensions, ~80MB, very fast on CPU).
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-        print(f"📦 Loading embedding model: {model_name}...")
-        self._model = SentenceTransformer(model_name)
+    # Below this many texts, spawning workers (each loads the model) costs more than it saves
+    PARALLEL_MIN_TEXTS = 2000
+
+    def __init__(self, model_name: str = DEFAULT_MODEL):
+        settings = get_settings()
+        print(f"📦 Loading embedding model: {model_name} ({settings.embedding_backend})...")
+        if settings.embedding_backend == "onnx":
+            # ONNX Runtime with the graph-optimized export shipped in the model repo
+            self._model = SentenceTransformer(
+                model_name,
+                backend="onnx",
+                model_kwargs={
+                    "file_name": (
+                        ONNX_INT8_FILE if settings.embedding_onnx_int8
+                        else settings.embedding_onnx_file
+                    ),
+                    "provider": "CPUExecutionProvider",
+                },
+            )
+        else:
+            self._model = SentenceTransformer(model_name)
         self._dimension = 384
+        self._half_precision = settings.embedding_half_precision
         print(f"✅ Embedding model loaded. Dimension: {self._dimension}")
 
     @property
@@ -31,14 +69,56 @@ class EmbeddingClient:
         return embedding.tolist()
 
     def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
-        """Generate embeddings for multiple texts efficiently."""
-        embeddings = self._model.encode(
-            texts,
+        """
+        Generate embeddings for multiple texts efficiently.
+        encode() length-sorts the inputs (and restores their order), so
+        mixed-length lists are padded per batch rather than to the longest text.
+        Identical texts are encoded once and the result shared.
+        """
+        unique = list(dict.fromkeys(texts))
+        embeddings = self._to_storage(self._model.encode(
+            unique,
             batch_size=batch_size,
             normalize_embeddings=True,
             show_progress_bar=True,
-        )
-        return embeddings.tolist()
+        ))
+        if len(unique) == len(texts):
+            return embeddings
+        by_text = dict(zip(unique, embeddings))
+        return [by_text[text] for text in texts]
+
+    def embed_batch_parallel(
+        self, texts: list[str], batch_size: int = 32, processes: int | None = None
+    ) -> list[list[float]]:
+        """
+        Like embed_batch, but shards large inputs across CPU worker processes
+        (one model copy each). Small inputs go through embed_batch.
+        """
+        processes = processes or max(1, (os.cpu_count() or 1) // 2)
+        unique = list(dict.fromkeys(texts))
+        if processes < 2 or len(unique) < self.PARALLEL_MIN_TEXTS:
+            return self.embed_batch(texts, batch_size=batch_size)
+
+        pool = self._model.start_multi_process_pool(target_devices=["cpu"] * processes)
+        try:
+            embeddings = self._to_storage(self._model.encode_multi_process(
+                unique, pool, batch_size=batch_size, normalize_embeddings=True,
+            ))
+        finally:
+            self._model.stop_multi_process_pool(pool)
+        by_text = dict(zip(unique, embeddings))
+        return [by_text[text] for text in texts]
+
+    def _to_storage(self, embeddings: np.ndarray) -> list[list[float]]:
+        """
+        Convert encoded vectors to the lists we store.
+        With EMBEDDING_HALF_PRECISION on, values are cut to float16 precision
+        (matching a pgvector halfvec(384) column) and serialized with 5 decimals,
+        which roughly halves the JSON sent per embedding.
+        """
+        if not self._half_precision:
+            return embeddings.tolist()
+        return np.round(embeddings.astype(np.float16).astype(np.float64), 5).tolist()
 
     def similarity(self, embedding_a: list[float], embedding_b: list[float]) -> float:
         """Compute cosine similarity between two embeddings."""
@@ -49,11 +129,15 @@ class EmbeddingClient:
 
 # --- Singleton ---
 _embedding_client: EmbeddingClient | None = None
+_embedding_client_lock = threading.Lock()
 
 
 def get_embedding_client() -> EmbeddingClient:
     """Returns a cached embedding client instance."""
     global _embedding_client
     if _embedding_client is None:
-        _embedding_client = EmbeddingClient()
+        # Scrapers call this from worker threads — load the model only once
+        with _embedding_client_lock:
+            if _embedding_client is None:
+                _embedding_client = EmbeddingClient()
     return _embedding_client
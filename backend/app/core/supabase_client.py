@@ -3,11 +3,31 @@ Jan-Seva AI — Supabase Client (Singleton)
 Provides a single, reusable connection to Supabase for all services.
 """
 
-from supabase import create_client, Client
+import httpx
+import orjson
+from supabase import create_client, Client, ClientOptions
 from functools import lru_cache
 from app.config import get_settings
 
 
+class OrjsonHTTPClient(httpx.Client):
+    """
+    httpx client that serializes `json=` bodies with orjson instead of stdlib json.
+    Bulk inserts carry hundreds of 384-float embeddings, where this is the main CPU cost.
+    numpy arrays are serialized natively, so callers may pass them without .tolist().
+    """
+
+    def build_request(self, method, url, *, content=None, json=None, headers=None, **kwargs):
+        if json is not None and content is None:
+            content = orjson.dumps(json, option=orjson.OPT_SERIALIZE_NUMPY)
+            headers = httpx.Headers(headers)
+            headers["Content-Type"] = "application/json"
+            json = None
+        return super().build_request(
+            method, url, content=content, json=json, headers=headers, **kwargs
+        )
+
+
 @lru_cache()
 def get_supabase_client() -> Client:
     """
@@ -18,6 +38,14 @@ def get_supabase_client() -> Client:
     client = create_client(
         supabase_url=settings.supabase_url,
         supabase_key=settings.supabase_service_role_key or settings.supabase_anon_key,
+        options=ClientOptions(
+            httpx_client=OrjsonHTTPClient(
+                timeout=120,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+            ),
+        ),
     )
     return client
 
@@ -34,6 +34,12 @@ async def lifespan(app: FastAPI):
 
     logger.info("👋 Jan-Seva AI shutting down...")
 
+    # Release pooled HTTP connections while their loop is still alive
+    from app.services.scraper.base_scraper import BaseScraper
+    from app.services.web_search_service import close_web_search_service
+    await BaseScraper.close()
+    await close_web_search_service()
+
 
 app = FastAPI(
     title="Jan-Seva AI",
@@ -120,8 +120,8 @@ class APIAggregator:
             return await self._handle_greeting(user_query, user_id, language)
 
         # ── Load session profile & history ──
-        profile = session_store.get_profile(effective_session)
-        session_history = session_store.get_chat_history(effective_session, last_n=8)
+        profile = await session_store.get_profile(effective_session)
+        session_history = await session_store.get_chat_history(effective_session, last_n=8)
         if chat_history:  # caller-supplied history takes precedence
             session_history = chat_history[-8:]
 
@@ -143,13 +143,13 @@ class APIAggregator:
 
         # Update session with newly discovered state
         if query_state and not profile.get("state"):
-            session_store.update_profile(effective_session, {
+            await session_store.update_profile(effective_session, {
                 "state_code": query_state["code"],
                 "state_name": query_state["name"],
             })
 
         # ── Mine query for profile data ──
-        self._mine_profile_from_query(user_query, effective_session)
+        await self._mine_profile_from_query(user_query, effective_session)
 
         # ── Translation (if not English) ──
         english_query = user_query
@@ -171,8 +171,8 @@ class APIAggregator:
         )
         if cached_payload:
             logger.info(f"Cache hit for intent={intent} lang={detected_lang} state={state_code or 'NA'}")
-            session_store.append_chat(effective_session, "user", user_query)
-            session_store.append_chat(effective_session, "assistant", cached_payload.get("answer", ""))
+            await session_store.append_chat(effective_session, "user", user_query)
+            await session_store.append_chat(effective_session, "assistant", cached_payload.get("answer", ""))
 
             cached_payload.setdefault("answer", "")
             cached_payload.setdefault("sources", [])
@@ -290,8 +290,8 @@ class APIAggregator:
             answer = await self._translate_response(answer, detected_lang)
 
         # ── Save to session history ──
-        session_store.append_chat(effective_session, "user", user_query)
-        session_store.append_chat(effective_session, "assistant", answer)
+        await session_store.append_chat(effective_session, "user", user_query)
+        await session_store.append_chat(effective_session, "assistant", answer)
 
         # ── Build source citations ──
         sources = []
@@ -536,7 +536,7 @@ INSTRUCTIONS:
     # Profile Mining
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _mine_profile_from_query(self, query: str, session_id: str) -> None:
+    async def _mine_profile_from_query(self, query: str, session_id: str) -> None:
         """
         Extract profile data from user's natural language message.
         Example: "I am a 25 year old SC farmer in Tamil Nadu with 2 acres"
@@ -612,7 +612,7 @@ INSTRUCTIONS:
                 pass
 
         if updates:
-            session_store.update_profile(session_id, updates)
+            await session_store.update_profile(session_id, updates)
             logger.info(f"👤 Mined profile updates for {session_id}: {updates}")
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -647,7 +647,7 @@ INSTRUCTIONS:
         try:
             from app.services.translation_service import get_translation_service
             translator = get_translation_service()
-            english = translator.translate(text, source=source_lang, target="en")
+            english = await translator.translate_async(text, source=source_lang, target="en")
             return english, source_lang
         except Exception as e:
             logger.warning(f"⚠️ Translation failed: {e}")
@@ -659,7 +659,7 @@ INSTRUCTIONS:
             translator = get_translation_service()
             detected = translator.detect_language(text)
             if detected != "en":
-                english = translator.translate(text, source=detected, target="en")
+                english = await translator.translate_async(text, source=detected, target="en")
                 return english, detected
             return text, "en"
         except Exception:
@@ -669,7 +669,7 @@ INSTRUCTIONS:
         try:
             from app.services.translation_service import get_translation_service
             translator = get_translation_service()
-            return translator.translate(text, source="en", target=target_lang)
+            return await translator.translate_async(text, source="en", target=target_lang)
         except Exception:
             return text
 
@@ -677,8 +677,13 @@ INSTRUCTIONS:
     # Audio Pipeline
     # ──────────────────────────────────────────────────────────────────────────
 
-    async def query_audio(self, audio_bytes: bytes, user_id: str = None, language: str = "auto") -> dict:
-        """Voice pipeline: Audio → STT → Query → TTS → Audio."""
+    async def query_audio(
+        self, audio_bytes: bytes, user_id: str = None, language: str = "auto", synthesize: bool = True
+    ) -> dict:
+        """
+        Voice pipeline: Audio → STT → Query → TTS → Audio.
+        With synthesize=False the TTS step is left to the caller (e.g. to stream it).
+        """
         from app.services.voice_service import get_voice_service
         voice = get_voice_service()
 
@@ -691,8 +696,8 @@ INSTRUCTIONS:
             language=detected_language,
         )
 
-        audio_path = await voice.synthesize(result["answer"], language=detected_language)
-        result["audio_url"] = audio_path
+        if synthesize:
+            result["audio_url"] = await voice.synthesize(result["answer"], language=detected_language)
         result["transcribed_text"] = transcribed_text
         return result
 
@@ -2,12 +2,124 @@
 Jan-Seva AI — Matching Service (Rule Engine)
 Evaluates user profiles against scheme eligibility rules (JSON Logic).
 """
-import json_logic
-from typing import List, Dict, Any
+import json
+import operator
+from functools import lru_cache, reduce
+from typing import List, Dict, Any, Callable
 from app.models.user import UserProfile
 from app.core.supabase_client import get_supabase_client
 from app.utils.logger import logger
 
+# --- JSON Logic compiler ---
+# Each rule is walked once into nested closures; evaluating a (user, scheme)
+# pair is then plain function calls, with no per-call op dispatch.
+# Operator semantics follow the json_logic package, except strict equality,
+# which compares type and value (json_logic 0.6.3 compared object identity).
+
+_OPS: Dict[str, Callable[..., Any]] = {
+    "==": operator.eq,
+    "===": lambda a, b: type(a) is type(b) and a == b,
+    "!=": operator.ne,
+    "!==": lambda a, b: not (type(a) is type(b) and a == b),
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": lambda a, b, c=None: a < b if c is None else a < b < c,
+    "<=": lambda a, b, c=None: a <= b if c is None else a <= b <= c,
+    "!": operator.not_,
+    "!!": bool,
+    "%": operator.mod,
+    "?:": lambda a, b, c: b if a else c,
+    "in": lambda a, b: a in b if hasattr(b, "__contains__") else False,
+    "cat": lambda *args: "".join(str(a) for a in args),
+    "+": lambda *args: sum(float(a) for a in args),
+    "*": lambda *args: reduce(lambda total, a: total * float(a), args, 1.0),
+    "-": lambda a, b=None: -a if b is None else a - b,
+    "/": lambda a, b=None: a if b is None else float(a) / float(b),
+    "min": lambda *args: min(args),
+    "max": lambda *args: max(args),
+    "count": lambda *args: sum(1 for a in args if a),
+}
+
+
+def _compile_var(path: Any, default: Any = None) -> Callable[[dict], Any]:
+    keys = [] if path in (None, "") else str(path).split(".")
+
+    def var(data: dict) -> Any:
+        for key in keys:
+            if isinstance(data, dict):
+                data = data.get(key, default)
+            elif isinstance(data, (list, tuple)) and key.lstrip("-").isdigit():
+                data = data[int(key)]
+            else:
+                return default
+        return data
+
+    return var
+
+
+def _compile(node: Any) -> Callable[[dict], Any]:
+    if not isinstance(node, dict):
+        return lambda data: node
+
+    (op, values), = node.items()
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    if op == "var":
+        # Paths are literals in practice; bind them now rather than per call
+        return _compile_var(*values)
+
+    args = [_compile(v) for v in values]
+
+    # and / or / if short-circuit (json_logic returns the same values eagerly)
+    if op == "and":
+        def and_(data: dict) -> Any:
+            result = True
+            for arg in args:
+                result = arg(data)
+                if not result:
+                    break
+            return result
+        return and_
+    if op == "or":
+        def or_(data: dict) -> Any:
+            result = False
+            for arg in args:
+                result = arg(data)
+                if result:
+                    break
+            return result
+        return or_
+    if op in ("if", "?:") and len(args) == 3:
+        cond, then, other = args
+        return lambda data: then(data) if cond(data) else other(data)
+
+    fn = _OPS.get(op)
+    if fn is None:
+        raise ValueError(f"Unrecognized JSON Logic operation: {op}")
+    if len(args) == 1:
+        arg, = args
+        return lambda data: fn(arg(data))
+    if len(args) == 2:
+        left, right = args
+        return lambda data: fn(left(data), right(data))
+    return lambda data: fn(*[arg(data) for arg in args])
+
+
+@lru_cache(maxsize=4096)
+def _compile_rule_json(rule_json: str) -> Callable[[dict], bool]:
+    evaluate = _compile(json.loads(rule_json))
+    return lambda data: bool(evaluate(data))
+
+
+def compile_rule(rule: dict) -> Callable[[dict], bool]:
+    """
+    Compiles a JSON Logic rule into a predicate over user data.
+    Cached on the canonical JSON, so a scheme's rules are compiled once
+    no matter how many times they are fetched.
+    """
+    return _compile_rule_json(json.dumps(rule, sort_keys=True))
+
 class MatchingService:
     def __init__(self):
         self.supabase = get_supabase_client()
@@ -51,8 +163,7 @@ class MatchingService:
             try:
                 # Normalize user data for logic engine
                 # e.g., ensure 'age', 'income' are numbers
-                from json_logic import jsonLogic
-                is_eligible = jsonLogic(rules, user_data)
+                is_eligible = compile_rule(rules)(user_data)
                 
                 if is_eligible:
                     matches.append({**scheme, "match_confidence": "High (Verified by Rule Engine)"})
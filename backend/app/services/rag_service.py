@@ -156,9 +156,9 @@ class RAGService:
                 if language == "auto":
                     detected_lang = translator.detect_language(user_query)
                     if detected_lang != "en":
-                        english_query = translator.translate(user_query, source=detected_lang, target="en")
+                        english_query = await translator.translate_async(user_query, source=detected_lang, target="en")
                 else:
-                    english_query = translator.translate(user_query, source=language, target="en")
+                    english_query = await translator.translate_async(user_query, source=language, target="en")
                     detected_lang = language
             except Exception as e:
                 logger.warning(f"⚠️ Translation failed (proceeding with original text): {e}")
@@ -273,7 +273,7 @@ class RAGService:
             try:
                 from app.services.translation_service import get_translation_service
                 translator = get_translation_service()
-                answer = translator.translate(answer, source="en", target=detected_lang)
+                answer = await translator.translate_async(answer, source="en", target=detected_lang)
             except Exception as e:
                 logger.warning(f"⚠️ Response translation failed (returning English): {e}")
 
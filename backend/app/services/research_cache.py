@@ -18,13 +18,21 @@ from app.utils.logger import logger
 class ResearchCache:
     """SQLite-backed cache for query outputs."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_minutes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """Arguments override the matching RESEARCH_CACHE_* settings when given."""
         settings = get_settings()
-        self.enabled = settings.research_cache_enabled
-        self.ttl_seconds = max(1, settings.research_cache_ttl_minutes) * 60
+        self.enabled = settings.research_cache_enabled if enabled is None else enabled
+        if ttl_minutes is None:
+            ttl_minutes = settings.research_cache_ttl_minutes
+        self.ttl_seconds = max(1, ttl_minutes) * 60
         self._lock = threading.Lock()
 
-        db_path = Path(settings.research_cache_path)
+        db_path = Path(path or settings.research_cache_path)
         if not db_path.is_absolute():
             backend_root = Path(__file__).resolve().parents[2]
             db_path = backend_root / db_path
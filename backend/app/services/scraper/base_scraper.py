@@ -10,12 +10,18 @@ Abstract base class for all scrapers with shared utilities:
 
 import re
 import time
+import random
 import hashlib
 import asyncio
 import requests
+import httpx
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
 from app.core.supabase_client import get_supabase_client
@@ -23,6 +29,90 @@ from app.core.embedding_client import get_embedding_client
 from app.utils.logger import logger
 
 
+# Inline scripts, stylesheets and icon SVGs make up most of a portal page's
+# bytes but never carry scheme text — drop them before building the tree
+_NON_CONTENT_BLOCKS = re.compile(r"<(script|style|svg)\b[^>]*>.*?</\1\s*>", re.I | re.S)
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    """Parse HTML into BeautifulSoup, skipping script/style/svg subtrees."""
+    return BeautifulSoup(_NON_CONTENT_BLOCKS.sub("", html), "html.parser")
+
+
+def bounded_text(node, limit: int) -> str:
+    """
+    Equivalent to node.get_text(strip=True)[:limit], but stops walking
+    text nodes once limit characters are collected.
+    """
+    parts = []
+    size = 0
+    for text in node.stripped_strings:
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+@lru_cache(maxsize=4096)
+def _slugify(name: str) -> str:
+    """Memoized slug builder — scheme names repeat across pages and sources."""
+    slug = name.lower().strip()
+    slug = re.sub(r"[^a-z0-9\s-]", "", slug)
+    slug = re.sub(r"[\s]+", "-", slug)
+    slug = re.sub(r"-+", "-", slug).strip("-")
+    return slug[:100]
+
+
+class HostRateLimiter:
+    """
+    Per-host concurrency cap plus server-driven pause.
+    Each host gets its own semaphore; Retry-After / X-RateLimit-* headers
+    push back the next allowed request time for that host.
+    """
+
+    def __init__(self, concurrency: int = 8):
+        self.concurrency = concurrency
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._resume_at: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def acquire(self, host: str):
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = self._semaphores[host] = asyncio.Semaphore(self.concurrency)
+
+        async with sem:
+            wait = self._resume_at.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+
+    def update_from_headers(self, host: str, headers) -> None:
+        """Pause the host if the server told us to slow down."""
+        delay = 0.0
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = 0.0
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                delay = float(headers.get("X-RateLimit-Reset", 1))
+            except ValueError:
+                delay = 1.0
+            # Some servers send an epoch timestamp instead of seconds
+            if delay > time.time():
+                delay -= time.time()
+
+        if delay > 0:
+            self._resume_at[host] = max(self._resume_at.get(host, 0.0), time.monotonic() + min(delay, 120))
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for all Jan-Seva scrapers.
@@ -36,14 +126,27 @@ class BaseScraper(ABC):
         "insurance", "loan", "housing", "skill", "training", "stipend",
         "relief", "compensation", "samman", "nidhi", "abhiyan", "mission",
     ]
+    # All keywords in one alternation — a single scan instead of one per keyword
+    _SCHEME_KEYWORD_RE = re.compile("|".join(map(re.escape, SCHEME_KEYWORDS)), re.I)
 
     USER_AGENT = "Mozilla/5.0 (compatible; JanSevaBot/1.0; +https://janseva.ai)"
 
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    # Shared across all scrapers — keep-alive connections and per-host limits
+    _session: Optional[httpx.AsyncClient] = None
+    _host_limiter = HostRateLimiter()
+
+    EMBED_WORKERS = 4
+    EMBED_BATCH_SIZE = 32
+
     def __init__(self):
         self._client = get_supabase_client()
         self._embedder = get_embedding_client()
         self._last_request_time = 0.0
         self._min_delay = 2.0  # seconds between requests
+        self._embed_queue: Optional[asyncio.Queue] = None
+        self._embed_workers: list[asyncio.Task] = []
 
     # ══════════════════════════════════════════
     # HTTP Fetch with Rate Limiting & Retry
@@ -85,7 +188,68 @@ class BaseScraper(ABC):
     def fetch_html(self, url: str) -> BeautifulSoup:
         """Fetch a URL and return parsed BeautifulSoup."""
         response = self.fetch_page(url)
-        return BeautifulSoup(response.text, "html.parser")
+        return parse_html(response.text)
+
+    @classmethod
+    def _get_session(cls) -> httpx.AsyncClient:
+        """Lazily create the shared async HTTP client."""
+        if BaseScraper._session is None or BaseScraper._session.is_closed:
+            BaseScraper._session = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=60,
+                ),
+                timeout=httpx.Timeout(30.0),
+                headers={"User-Agent": cls.USER_AGENT},
+                follow_redirects=True,
+                verify=False,  # Some govt sites have expired certs
+            )
+        return BaseScraper._session
+
+    @classmethod
+    async def close(cls):
+        """Close the shared HTTP client. Call on shutdown."""
+        if BaseScraper._session is not None and not BaseScraper._session.is_closed:
+            await BaseScraper._session.aclose()
+        BaseScraper._session = None
+
+    async def async_fetch_page(self, url: str, retries: int = 3, **kwargs) -> httpx.Response:
+        """
+        Non-blocking fetch through the shared client.
+        Limited per host; retries 429/5xx and transport errors (timeouts,
+        connect failures, resets) with jittered exponential backoff.
+        """
+        host = urlparse(url).netloc
+        session = self._get_session()
+
+        for attempt in range(retries):
+            try:
+                async with self._host_limiter.acquire(host):
+                    response = await session.get(url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == retries - 1:
+                    raise
+                failure = f"failed ({type(e).__name__}: {e})"
+            else:
+                self._host_limiter.update_from_headers(host, response.headers)
+
+                if response.status_code not in self.RETRY_STATUSES or attempt == retries - 1:
+                    response.raise_for_status()
+                    return response
+                failure = f"got {response.status_code}"
+
+            wait = 2 ** attempt + random.random()
+            logger.warning(
+                f"Fetch attempt {attempt+1}/{retries} {failure} for {url}. "
+                f"Retrying in {wait:.1f}s..."
+            )
+            await asyncio.sleep(wait)
+
+    async def async_fetch_html(self, url: str) -> BeautifulSoup:
+        """Async counterpart of fetch_html."""
+        response = await self.async_fetch_page(url)
+        return parse_html(response.text)
 
     # ══════════════════════════════════════════
     # Text Chunking (with overlap)
@@ -174,17 +338,99 @@ class BaseScraper(ABC):
 
         return stored
 
+    def bulk_create_and_store_embeddings(self, jobs: list[tuple]) -> int:
+        """
+        Chunk, embed and store several texts at once.
+        jobs: (scheme_id, text, source_url, source_name) tuples.
+        One embedding call and one insert for the whole batch.
+        """
+        chunk_jobs = [(job, self.chunk_text(job[1])) for job in jobs]
+        all_chunks = [chunk for _, chunks in chunk_jobs for chunk in chunks]
+        if not all_chunks:
+            return 0
+
+        embeddings = iter(self._embedder.embed_batch(all_chunks))
+        scraped_at = datetime.utcnow().isoformat()
+        records = []
+        for (scheme_id, _, source_url, source_name), chunks in chunk_jobs:
+            for i, chunk in enumerate(chunks):
+                record = {
+                    "chunk_text": chunk,
+                    "chunk_index": i,
+                    "embedding": next(embeddings),
+                    "metadata": {
+                        "source_url": source_url,
+                        "source_name": source_name,
+                        "scraped_at": scraped_at,
+                    },
+                }
+                if scheme_id:
+                    record["scheme_id"] = scheme_id
+                records.append(record)
+
+        try:
+            self._client.table("scheme_embeddings").insert(records).execute()
+            return len(records)
+        except Exception as e:
+            logger.error(f"Failed to store {len(records)} embedding chunks: {e}")
+            return 0
+
+    # ══════════════════════════════════════════
+    # Background Embedding Queue
+    # ══════════════════════════════════════════
+
+    async def queue_embeddings(
+        self,
+        text: str,
+        scheme_id: Optional[str] = None,
+        source_url: str = "",
+        source_name: str = "",
+    ):
+        """
+        Hand text off to background embedding workers and return immediately.
+        Call flush_embeddings() before the scrape finishes.
+        """
+        if self._embed_queue is None:
+            self._embed_queue = asyncio.Queue(maxsize=256)
+            self._embed_workers = [
+                asyncio.create_task(self._embed_worker()) for _ in range(self.EMBED_WORKERS)
+            ]
+        await self._embed_queue.put((scheme_id, text, source_url, source_name))
+
+    async def _embed_worker(self):
+        """Drain up to EMBED_BATCH_SIZE queued jobs at a time and store them."""
+        queue = self._embed_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.EMBED_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                # Embedding + Supabase calls are blocking — keep them off the loop
+                await asyncio.to_thread(self.bulk_create_and_store_embeddings, batch)
+            except Exception as e:
+                logger.error(f"Embedding worker failed on batch of {len(batch)}: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush_embeddings(self):
+        """Wait for all queued embeddings to be stored, then stop the workers."""
+        if self._embed_queue is None:
+            return
+        await self._embed_queue.join()
+        for task in self._embed_workers:
+            task.cancel()
+        await asyncio.gather(*self._embed_workers, return_exceptions=True)
+        self._embed_queue = None
+        self._embed_workers = []
+
     # ══════════════════════════════════════════
     # Scheme Upsert with Deduplication
     # ══════════════════════════════════════════
 
     def generate_slug(self, name: str) -> str:
         """Generate a URL-safe slug from scheme name."""
-        slug = name.lower().strip()
-        slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-        slug = re.sub(r"[\s]+", "-", slug)
-        slug = re.sub(r"-+", "-", slug).strip("-")
-        return slug[:100]
+        return _slugify(name)
 
     def upsert_scheme(self, scheme_data: dict) -> Optional[str]:
         """
@@ -230,8 +476,7 @@ class BaseScraper(ABC):
 
     def contains_scheme_keywords(self, text: str) -> bool:
         """Check if text contains scheme-related keywords."""
-        text_lower = text.lower()
-        return any(kw in text_lower for kw in self.SCHEME_KEYWORDS)
+        return self._SCHEME_KEYWORD_RE.search(text) is not None
 
     # ══════════════════════════════════════════
     # Scraper Run Logging
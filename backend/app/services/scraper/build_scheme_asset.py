@@ -0,0 +1,40 @@
+"""
+Jan-Seva AI — Scheme Embedding Asset Builder
+Encodes every seed scheme once and writes data/scheme_embeddings.npz, so
+seeding a fresh database needs no model load or encode work.
+Run: python -m app.services.scraper.build_scheme_asset
+"""
+
+import numpy as np
+
+from app.core.embedding_client import get_embedding_client, embedding_model_id
+from app.services.scraper.seed_schemes import (
+    EMBED_BATCH_SIZE,
+    EMBEDDINGS_ASSET_PATH,
+    _build_embed_text,
+    get_schemes,
+    text_hash,
+)
+from app.utils.logger import logger
+
+
+def build_scheme_asset() -> int:
+    """Encode all seed schemes and save (slug, text_hash, float16 embedding) rows."""
+    schemes = get_schemes()
+    texts = [_build_embed_text(scheme.to_row()) for scheme in schemes]
+    logger.info(f"🧠 Encoding {len(texts)} schemes for the embedding asset...")
+    embeddings = get_embedding_client().embed_batch_parallel(texts, batch_size=EMBED_BATCH_SIZE)
+
+    np.savez_compressed(
+        EMBEDDINGS_ASSET_PATH,
+        model=np.array(embedding_model_id()),
+        slugs=np.array([scheme.slug for scheme in schemes]),
+        text_hashes=np.array([text_hash(text) for text in texts]),
+        embeddings=np.asarray(embeddings, dtype=np.float16),
+    )
+    logger.info(f"💾 Wrote {len(texts)} embeddings to {EMBEDDINGS_ASSET_PATH}")
+    return len(texts)
+
+
+if __name__ == "__main__":
+    build_scheme_asset()
@@ -6,16 +6,55 @@ Three scraping strategies:
   3. HTML Scraper — For simple HTML pages using BeautifulSoup
 """
 
+import os
 import re
 import json
-import time
+import atexit
+import asyncio
 from typing import Optional
 from datetime import datetime
 
-from app.services.scraper.base_scraper import BaseScraper
+import orjson
+import soupsieve
+from bs4 import BeautifulSoup
+
+from app.services.scraper.base_scraper import BaseScraper, bounded_text, parse_html, _slugify
 from app.utils.logger import logger
 
 
+# Common patterns for scheme listings, most specific first.
+# Each group is matched in a single DOM walk via the CSS comma operator.
+SELENIUM_CARD_SELECTORS = (
+    "a[href*='scheme']", ".scheme-card", ".scheme-item",
+    ".card", ".list-group-item", "div[class*='scheme']",
+    "table tr", "li a",
+)
+HTML_CARD_SELECTORS = (
+    "a[href*='scheme']",
+    ".scheme-card", ".scheme-item", ".scheme-list li",
+    "table tr", ".card", ".list-group-item",
+    "div[class*='scheme']", "div[class*='Scheme']",
+)
+
+# Source-name fragments -> state, matched in one regex scan
+_STATE_LOOKUP = {
+    "tamil": "Tamil Nadu", "tn ": "Tamil Nadu",
+    "kerala": "Kerala",
+    "andhra": "Andhra Pradesh", "ap ": "Andhra Pradesh",
+    "karnataka": "Karnataka",
+    "maharashtra": "Maharashtra", "mh ": "Maharashtra",
+    "uttar": "Uttar Pradesh", "up ": "Uttar Pradesh",
+    "rajasthan": "Rajasthan",
+}
+_STATE_RE = re.compile("(" + "|".join(map(re.escape, _STATE_LOOKUP)) + ")")
+_HTML_STATE_RE = re.compile(r"(tamil|kerala|andhra)")
+
+_PROBE_CARDS = soupsieve.compile("a[href*='scheme'], .scheme-card, .scheme-item")
+_SELENIUM_CARDS = soupsieve.compile(", ".join(SELENIUM_CARD_SELECTORS))
+_HTML_CARDS = soupsieve.compile(", ".join(HTML_CARD_SELECTORS))
+_HTML_CARD_PATTERNS = tuple(soupsieve.compile(sel) for sel in HTML_CARD_SELECTORS)
+
+
 class MySchemeAPIScraper(BaseScraper):
     """
     Scrapes MyScheme.gov.in using its internal search API.
@@ -36,11 +75,11 @@ class MySchemeAPIScraper(BaseScraper):
 
             while True:
                 try:
-                    response = self.fetch_page(
-                        f"{self.API_URL}?page={page}&per_page={per_page}",
-                        timeout=30,
+                    response = await self.async_fetch_page(
+                        self.API_URL,
+                        params={"page": page, "per_page": per_page},
                     )
-                    data = response.json()
+                    data = orjson.loads(response.content)
                 except Exception:
                     logger.warning("MyScheme API unavailable, falling back to Selenium")
                     return await self._scrape_selenium_fallback(source)
@@ -59,9 +98,8 @@ class MySchemeAPIScraper(BaseScraper):
                                 f"{scheme_data.get('description', '')}. "
                                 f"Benefits: {scheme_data.get('benefits', '')}."
                             )
-                            chunks = self.chunk_text(embed_text)
-                            self.create_and_store_embeddings(
-                                chunks, scheme_id, source["url"], source["name"]
+                            await self.queue_embeddings(
+                                embed_text, scheme_id, source["url"], source["name"]
                             )
                             total_scraped += 1
 
@@ -77,6 +115,9 @@ class MySchemeAPIScraper(BaseScraper):
             result["error_message"] = str(e)
             logger.error(f"MyScheme scraper failed: {e}")
 
+        finally:
+            await self.flush_embeddings()
+
         self.log_scraper_run(source["url"], result["status"], result["schemes_found"])
         return result
 
@@ -87,9 +128,10 @@ class MySchemeAPIScraper(BaseScraper):
             if not name:
                 return None
 
+            slug = self.generate_slug(name)
             return {
                 "name": name,
-                "slug": self.generate_slug(name),
+                "slug": slug,
                 "description": raw.get("schemeDescription", raw.get("description", "")),
                 "ministry": raw.get("ministry", raw.get("nodalMinistry", "")),
                 "department": raw.get("department", raw.get("nodalDepartment", "")),
@@ -99,7 +141,7 @@ class MySchemeAPIScraper(BaseScraper):
                 "documents_required": raw.get("documentsRequired", []),
                 "how_to_apply": raw.get("howToApply", raw.get("applicationProcess", "")),
                 "application_url": raw.get("applicationUrl", raw.get("schemeUrl", "")),
-                "source_url": f"{self.BASE_URL}/schemes/{self.generate_slug(name)}",
+                "source_url": f"{self.BASE_URL}/schemes/{slug}",
                 "source_type": "api",
             }
         except Exception as e:
@@ -116,61 +158,64 @@ class SeleniumPortalScraper(BaseScraper):
     """
     Selenium-powered scraper for JavaScript-heavy government portals.
     Uses undetected-chromedriver to avoid bot detection.
+    Chrome instances are pooled across scrape() calls to skip cold starts.
     """
 
+    POOL_SIZE = min(4, os.cpu_count() or 1)
+
+    # Shared across all instances — drivers are expensive to start
+    _driver_pool: Optional[asyncio.Queue] = None
+    _pooled_drivers: list = []
+
     async def scrape(self, source: dict) -> dict:
         """Scrape a JS-heavy portal page using Selenium."""
         result = {"source": source["name"], "schemes_found": 0, "status": "started"}
 
+        # Static pages don't need a browser — probe with plain HTTP first
+        probe_soup = await self._probe_static_html(source["url"])
+        if probe_soup is not None:
+            logger.info(f"{source['name']} renders without JS, skipping Selenium")
+            html_scraper = HTMLPortalScraper()
+            return await html_scraper.scrape(source, soup=probe_soup)
+
         driver = None
         try:
-            driver = self._get_driver()
+            driver = await self._acquire_driver()
             if not driver:
                 # Fallback to plain HTML if Selenium fails
                 logger.warning("Selenium not available, falling back to HTML scraping")
                 html_scraper = HTMLPortalScraper()
                 return await html_scraper.scrape(source)
 
-            # Navigate to page
+            # Navigate to page and wait for JS to render scheme content
             driver.get(source["url"])
-            time.sleep(3)  # Wait for JS to render
+            self._wait_for_content(driver)
 
             # Scroll down to load dynamic content
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
+            self._scroll_until_stable(driver)
 
             # Get rendered page source
             page_source = driver.page_source
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(page_source, "html.parser")
-
-            # Find scheme links/cards
-            scheme_elements = []
+            soup = parse_html(page_source)
 
-            # Common patterns for scheme listings
-            for selector in [
-                "a[href*='scheme']", ".scheme-card", ".scheme-item",
-                ".card", ".list-group-item", "div[class*='scheme']",
-                "table tr", "li a",
-            ]:
-                elements = soup.select(selector)
-                if elements:
-                    scheme_elements.extend(elements)
+            # Find scheme links/cards — one walk, unique nodes in document order
+            scheme_elements = _SELENIUM_CARDS.select(soup)
 
             # Process found elements
             seen_slugs = set()
+            listed_urls = set()  # Cards already rich enough to skip their detail page
             for el in scheme_elements[:50]:
                 scheme = self._extract_scheme_from_element(el, source)
                 if scheme and scheme["slug"] not in seen_slugs:
                     seen_slugs.add(scheme["slug"])
+                    if not self._needs_detail(scheme):
+                        listed_urls.add(scheme["source_url"].rstrip("/"))
                     scheme_id = self.upsert_scheme(scheme)
                     if scheme_id:
                         embed_text = f"{scheme['name']}. {scheme.get('description', '')}"
-                        chunks = self.chunk_text(embed_text)
-                        self.create_and_store_embeddings(
-                            chunks, scheme_id, source["url"], source["name"]
+                        await self.queue_embeddings(
+                            embed_text, scheme_id, source["url"], source["name"]
                         )
                         result["schemes_found"] += 1
 
@@ -180,7 +225,7 @@ class SeleniumPortalScraper(BaseScraper):
                 href = link["href"]
                 if "/schemes/" in href or "/scheme/" in href:
                     full_url = href if href.startswith("http") else f"{source['url'].rstrip('/')}{href}"
-                    if full_url not in scheme_links:
+                    if full_url not in scheme_links and full_url.rstrip("/") not in listed_urls:
                         scheme_links.append(full_url)
 
             for url in scheme_links[:20]:
@@ -191,9 +236,8 @@ class SeleniumPortalScraper(BaseScraper):
                         scheme_id = self.upsert_scheme(detail)
                         if scheme_id:
                             embed_text = f"{detail['name']}. {detail.get('description', '')}"
-                            chunks = self.chunk_text(embed_text)
-                            self.create_and_store_embeddings(
-                                chunks, scheme_id, url, source["name"]
+                            await self.queue_embeddings(
+                                embed_text, scheme_id, url, source["name"]
                             )
                             result["schemes_found"] += 1
                 except Exception as e:
@@ -207,15 +251,130 @@ class SeleniumPortalScraper(BaseScraper):
             logger.error(f"Selenium scraper failed for {source['name']}: {e}")
 
         finally:
+            await self.flush_embeddings()
             if driver:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
+                await self._release_driver(driver)
 
         self.log_scraper_run(source["url"], result["status"], result["schemes_found"])
         return result
 
+    DETAIL_MIN_DESCRIPTION = 200
+
+    def _needs_detail(self, scheme: dict) -> bool:
+        """A listing card with a short description is worth a detail page render."""
+        return len(scheme.get("description", "")) < self.DETAIL_MIN_DESCRIPTION
+
+    PROBE_MIN_MATCHES = 5
+    PROBE_MIN_CHARS = 2048  # Smaller pages are usually an empty JS app shell
+
+    async def _probe_static_html(self, url: str):
+        """
+        Fetch the page without a browser.
+        Returns the parsed soup if it already lists schemes, else None.
+        """
+        try:
+            response = await self.async_fetch_page(url)
+        except Exception as e:
+            logger.debug(f"Static probe failed for {url}: {e}")
+            return None
+
+        if len(response.text) < self.PROBE_MIN_CHARS:
+            return None
+
+        soup = parse_html(response.text)
+        if len(_PROBE_CARDS.select(soup, limit=self.PROBE_MIN_MATCHES)) < self.PROBE_MIN_MATCHES:
+            return None
+        return soup
+
+    # ══════════════════════════════════════════
+    # Driver Pool
+    # ══════════════════════════════════════════
+
+    async def _acquire_driver(self):
+        """
+        Take a driver from the shared pool.
+        Starts a new one while the pool is below POOL_SIZE, otherwise waits for a free one.
+        """
+        cls = SeleniumPortalScraper
+        if cls._driver_pool is None:
+            cls._driver_pool = asyncio.Queue()
+            atexit.register(cls.close_driver_pool)
+
+        if cls._driver_pool.empty() and len(cls._pooled_drivers) < cls.POOL_SIZE:
+            driver = self._get_driver()
+            if driver:
+                cls._pooled_drivers.append(driver)
+            return driver
+
+        return await cls._driver_pool.get()
+
+    async def _release_driver(self, driver):
+        """Reset session state and hand the driver back to the pool."""
+        cls = SeleniumPortalScraper
+        try:
+            driver.delete_all_cookies()
+        except Exception:
+            # Driver crashed mid-scrape — replace it so waiters aren't starved
+            if driver in cls._pooled_drivers:
+                cls._pooled_drivers.remove(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            driver = self._get_driver()
+            if not driver:
+                return
+            cls._pooled_drivers.append(driver)
+
+        await cls._driver_pool.put(driver)
+
+    @classmethod
+    def close_driver_pool(cls):
+        """Quit every pooled driver. Registered with atexit on first use."""
+        for driver in cls._pooled_drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        cls._pooled_drivers.clear()
+        cls._driver_pool = None
+
+    # ══════════════════════════════════════════
+    # Page Readiness
+    # ══════════════════════════════════════════
+
+    CONTENT_SELECTOR = "a[href*='scheme'], .scheme-card, h1"
+
+    def _wait_for_content(self, driver, selector: str = CONTENT_SELECTOR, timeout: float = 8):
+        """Block until an element matching selector is present (or timeout)."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except Exception:
+            # Timed out — scrape whatever has rendered so far
+            logger.debug(f"No '{selector}' after {timeout}s on {driver.current_url}")
+
+    def _scroll_until_stable(self, driver, max_scrolls: int = 3, timeout: float = 2):
+        """Scroll to the bottom until page height stops growing."""
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        height_js = "return document.body.scrollHeight"
+        last_height = driver.execute_script(height_js)
+        for _ in range(max_scrolls):
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                    lambda d: d.execute_script(height_js) > last_height
+                )
+            except Exception:
+                break  # Nothing more lazy-loaded
+            last_height = driver.execute_script(height_js)
+
     def _get_driver(self):
         """Create Selenium Chrome driver with stealth options."""
         try:
@@ -230,6 +389,17 @@ class SeleniumPortalScraper(BaseScraper):
             options.add_argument("--window-size=1920,1080")
             options.add_argument(f"--user-agent={self.USER_AGENT}")
 
+            # Only the DOM matters — don't download images, CSS, fonts or plugins
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+                "profile.managed_default_content_settings.plugins": 2,
+            })
+            # Return from driver.get() at DOMContentLoaded; _wait_for_content handles the rest
+            options.page_load_strategy = "eager"
+
             # Try undetected-chromedriver first
             try:
                 import undetected_chromedriver as uc
@@ -250,10 +420,9 @@ class SeleniumPortalScraper(BaseScraper):
         """Scrape a single scheme detail page using Selenium."""
         try:
             driver.get(url)
-            time.sleep(2)
+            self._wait_for_content(driver, selector="h1, h2")
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            soup = parse_html(driver.page_source)
 
             title = soup.find("h1") or soup.find("h2")
             name = title.get_text(strip=True) if title else ""
@@ -262,7 +431,7 @@ class SeleniumPortalScraper(BaseScraper):
 
             # Extract description
             content = soup.find("div", class_=re.compile(r"content|description|detail|main", re.I))
-            description = content.get_text(strip=True)[:2000] if content else ""
+            description = bounded_text(content, 2000) if content else ""
 
             return {
                 "name": name,
@@ -287,13 +456,13 @@ class SeleniumPortalScraper(BaseScraper):
             elif link:
                 name = link.get_text(strip=True)
             else:
-                name = element.get_text(strip=True)[:100]
+                name = bounded_text(element, 100)
 
             if not name or len(name) < 5:
                 return None
 
             desc_el = element.find("p") or element.find("div", class_=re.compile(r"desc|detail|content", re.I))
-            description = desc_el.get_text(strip=True)[:1000] if desc_el else ""
+            description = bounded_text(desc_el, 1000) if desc_el else ""
 
             url = ""
             if link and link.get("href"):
@@ -314,20 +483,8 @@ class SeleniumPortalScraper(BaseScraper):
 
     def _detect_state_from_source(self, source: dict) -> str:
         """Detect state from source name."""
-        name = source.get("name", "").lower()
-        state_map = {
-            "tamil": "Tamil Nadu", "tn ": "Tamil Nadu",
-            "kerala": "Kerala",
-            "andhra": "Andhra Pradesh", "ap ": "Andhra Pradesh",
-            "karnataka": "Karnataka",
-            "maharashtra": "Maharashtra", "mh ": "Maharashtra",
-            "uttar": "Uttar Pradesh", "up ": "Uttar Pradesh",
-            "rajasthan": "Rajasthan",
-        }
-        for key, state in state_map.items():
-            if key in name:
-                return state
-        return "Central"
+        m = _STATE_RE.search(source.get("name", "").lower())
+        return _STATE_LOOKUP[m.group(1)] if m else "Central"
 
 
 class HTMLPortalScraper(BaseScraper):
@@ -336,25 +493,33 @@ class HTMLPortalScraper(BaseScraper):
     Works for simpler sites using BeautifulSoup.
     """
 
-    async def scrape(self, source: dict) -> dict:
-        """Scrape scheme data from an HTML portal page."""
+    MAX_CARDS = 30  # Cards extracted per selector
+
+    async def scrape(self, source: dict, soup: Optional[BeautifulSoup] = None) -> dict:
+        """
+        Scrape scheme data from an HTML portal page.
+        Pass an already-parsed soup to skip the fetch.
+        """
         result = {"source": source["name"], "schemes_found": 0, "status": "started"}
 
         try:
-            soup = self.fetch_html(source["url"])
+            if soup is None:
+                soup = await self.async_fetch_html(source["url"])
 
             schemes_found = []
-            selectors = [
-                "a[href*='scheme']",
-                ".scheme-card", ".scheme-item", ".scheme-list li",
-                "table tr", ".card", ".list-group-item",
-                "div[class*='scheme']", "div[class*='Scheme']",
-            ]
-
-            for selector in selectors:
-                elements = soup.select(selector)
+
+            # One walk collects every candidate; bucket by the most specific
+            # selector it matches so earlier selectors still take priority
+            buckets = [[] for _ in _HTML_CARD_PATTERNS]
+            for el in _HTML_CARDS.select(soup):
+                for i, pattern in enumerate(_HTML_CARD_PATTERNS):
+                    if pattern.match(el):
+                        buckets[i].append(el)
+                        break
+
+            for elements in buckets:
                 if elements:
-                    for el in elements[:30]:
+                    for el in elements[:self.MAX_CARDS]:
                         scheme = self._extract_scheme(el, source)
                         if scheme and scheme["name"]:
                             schemes_found.append(scheme)
@@ -384,9 +549,8 @@ class HTMLPortalScraper(BaseScraper):
                 scheme_id = self.upsert_scheme(scheme_data)
                 if scheme_id:
                     embed_text = f"{scheme_data['name']}. {scheme_data.get('description', '')}"
-                    chunks = self.chunk_text(embed_text)
-                    self.create_and_store_embeddings(
-                        chunks, scheme_id, source["url"], source["name"]
+                    await self.queue_embeddings(
+                        embed_text, scheme_id, source["url"], source["name"]
                     )
                     result["schemes_found"] += 1
 
@@ -397,53 +561,56 @@ class HTMLPortalScraper(BaseScraper):
             result["error_message"] = str(e)
             logger.error(f"HTML scraper failed for {source['name']}: {e}")
 
+        await self.flush_embeddings()
+
         self.log_scraper_run(source["url"], result["status"], result["schemes_found"])
         return result
 
     def _extract_scheme(self, element, source: dict) -> Optional[dict]:
         """Extract scheme from HTML element."""
-        try:
-            name = ""
-            link = element if element.name == "a" else element.find("a")
-            heading = element.find(["h1", "h2", "h3", "h4", "h5"])
-
-            if heading:
-                name = heading.get_text(strip=True)
-            elif link:
-                name = link.get_text(strip=True)
-            else:
-                name = element.get_text(strip=True)[:100]
+        return _extract_html_card(element, source)
 
-            if not name or len(name) < 5:
-                return None
 
-            desc_el = element.find("p")
-            description = desc_el.get_text(strip=True)[:1000] if desc_el else ""
-
-            url = ""
-            if link and link.get("href"):
-                href = link["href"]
-                url = href if href.startswith("http") else f"{source['url'].rstrip('/')}/{href.lstrip('/')}"
+def _extract_html_card(element, source: dict) -> Optional[dict]:
+    """Extract scheme from an HTML card element."""
+    try:
+        name = ""
+        link = element if element.name == "a" else element.find("a")
+        heading = element.find(["h1", "h2", "h3", "h4", "h5"])
 
-            name_lower = source.get("name", "").lower()
-            state = "Central"
-            for key, val in {"tamil": "Tamil Nadu", "kerala": "Kerala", "andhra": "Andhra Pradesh"}.items():
-                if key in name_lower:
-                    state = val
-                    break
+        if heading:
+            name = heading.get_text(strip=True)
+        elif link:
+            name = link.get_text(strip=True)
+        else:
+            name = bounded_text(element, 100)
 
-            return {
-                "name": name,
-                "slug": self.generate_slug(name),
-                "description": description,
-                "state": state,
-                "source_url": url or source["url"],
-                "source_type": "html",
-                "ministry": source.get("name", ""),
-            }
-        except Exception:
+        if not name or len(name) < 5:
             return None
 
+        desc_el = element.find("p")
+        description = bounded_text(desc_el, 1000) if desc_el else ""
+
+        url = ""
+        if link and link.get("href"):
+            href = link["href"]
+            url = href if href.startswith("http") else f"{source['url'].rstrip('/')}/{href.lstrip('/')}"
+
+        m = _HTML_STATE_RE.search(source.get("name", "").lower())
+        state = _STATE_LOOKUP[m.group(1)] if m else "Central"
+
+        return {
+            "name": name,
+            "slug": _slugify(name),
+            "description": description,
+            "state": state,
+            "source_url": url or source["url"],
+            "source_type": "html",
+            "ministry": source.get("name", ""),
+        }
+    except Exception:
+        return None
+
 
 # --- Singletons ---
 _myscheme_scraper: MySchemeAPIScraper | None = None
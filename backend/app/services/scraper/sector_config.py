@@ -3,6 +3,9 @@ Jan-Seva AI — Sector Configuration
 Defines seed URLs and search patterns for the Crawler Swarm.
 """
 
+import re
+from types import MappingProxyType
+
 SECTOR_CONFIG = {
     "central": {
         "seeds": [
@@ -48,5 +51,38 @@ SECTOR_CONFIG = {
     }
 }
 
-def get_sector_config(sector: str) -> dict:
-    return SECTOR_CONFIG.get(sector.lower(), {})
+# Freeze once at import: read-only views over tuples, so lookups never
+# rebuild lists and callers can't mutate the shared config
+SECTOR_CONFIG = MappingProxyType({
+    sector: MappingProxyType({key: tuple(values) for key, values in config.items()})
+    for sector, config in SECTOR_CONFIG.items()
+})
+
+_EMPTY = MappingProxyType({})
+
+
+def get_sector_config(sector: str) -> MappingProxyType:
+    return SECTOR_CONFIG.get(sector.lower(), _EMPTY)
+
+
+# keyword -> sectors that list it (e.g. "insurance" is both health and finance)
+_KEYWORD_SECTORS: dict[str, tuple[str, ...]] = {}
+for _sector, _config in SECTOR_CONFIG.items():
+    for _kw in _config["keywords"]:
+        _KEYWORD_SECTORS[_kw] = _KEYWORD_SECTORS.get(_kw, ()) + (_sector,)
+
+# Lookahead so overlapping keywords are all seen in one left-to-right pass
+_SECTOR_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_KEYWORD_SECTORS, key=len, reverse=True))) + "))",
+    re.I,
+)
+
+
+def classify_sectors(text: str) -> dict[str, int]:
+    """Count distinct keywords per sector found in text, in a single scan."""
+    found = {m.group(1).lower() for m in _SECTOR_KEYWORD_RE.finditer(text)}
+    scores: dict[str, int] = {}
+    for kw in found:
+        for sector in _KEYWORD_SECTORS[kw]:
+            scores[sector] = scores.get(sector, 0) + 1
+    return scores
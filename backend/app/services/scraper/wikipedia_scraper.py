@@ -7,23 +7,64 @@ No API key required — uses MediaWiki REST API.
 
 import re
 import json
-import requests
+import asyncio
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+from app.services.location_service import REGION_TO_STATE
 from app.services.scraper.base_scraper import BaseScraper
 from app.utils.logger import logger
 
 
+# Trailing disambiguation, e.g. "Scheme Name (India)"
+_DISAMBIG_RE = re.compile(r"\s*\(.*?\)\s*$")
+_BENEFIT_RE = re.compile(
+    r"(?:provides?|offers?|gives?|benefits?\s+include)\s+(.+?)(?:\.|$)", re.IGNORECASE
+)
+
+# One compiled detector for every state/UT: a named group per region, so
+# match.lastgroup identifies the first one mentioned. "New Delhi" is the
+# seat of the central government, not a sign of a Delhi scheme.
+_STATE_BY_GROUP = {f"s{i}": state["name"] for i, state in enumerate(REGION_TO_STATE.values())}
+_STATE_RE = re.compile(r"\b(?:" + "|".join(
+    f"(?P<s{i}>{'(?<!new )' if region == 'Delhi' else ''}{re.escape(region.lower())})"
+    for i, region in enumerate(REGION_TO_STATE)
+) + r")\b")
+
+# Wikipedia category keyword → scheme category
+CATEGORY_KEYWORDS = {
+    "agriculture": "Agriculture", "farming": "Agriculture", "rural": "Agriculture",
+    "education": "Education", "scholarship": "Education", "school": "Education",
+    "health": "Health", "medical": "Health", "hospital": "Health",
+    "housing": "Housing", "shelter": "Housing", "home": "Housing",
+    "women": "Women", "gender": "Women", "maternal": "Women",
+    "employment": "Employment", "labour": "Employment", "skill": "Employment",
+}
+CATEGORY_ORDER = list(dict.fromkeys(CATEGORY_KEYWORDS.values()))
+_CATEGORY_RE = re.compile("|".join(map(re.escape, CATEGORY_KEYWORDS)))
+
+
 class WikipediaScraper(BaseScraper):
     """
     Scrapes Wikipedia for government scheme articles.
     Uses the MediaWiki API (free, no key required).
-    Flow: Search → Get Article → Extract Sections → Chunk → Embed
+    Flow: Search (articles inline) → Extract Sections → Chunk → Embed
     """
 
     API_URL = "https://en.wikipedia.org/w/api.php"
 
+    # title → last processed revision id, so unchanged articles are skipped on
+    # the next run instead of being re-parsed and re-embedded
+    REVISIONS_PATH = Path(__file__).resolve().parents[3] / "data" / ".wikipedia_revisions.json"
+
+    # Ask the API to refuse requests while replica lag exceeds this many seconds
+    MAXLAG = 5
+    MAXLAG_RETRIES = 3
+
+    # Slugs per IN (...) lookup — keeps the request URL well under server limits
+    SLUG_LOOKUP_SIZE = 200
+
     # Search queries for discovering schemes
     SEARCH_QUERIES = [
         "Indian government schemes",
@@ -58,58 +99,81 @@ class WikipediaScraper(BaseScraper):
         }
 
         try:
-            all_articles = set()
+            # One generator=search request per query returns the articles too;
+            # queries run concurrently under the shared client's per-host limiter
+            searches = await asyncio.gather(
+                *(self._search_with_articles(query, limit=20) for query in self.SEARCH_QUERIES)
+            )
+            # A title found by several queries carries the same page data each time
+            all_articles = {title: article for articles in searches for title, article in articles.items()}
 
-            for query in self.SEARCH_QUERIES:
-                articles = self._search_articles(query, limit=20)
-                for title in articles:
-                    if title not in all_articles:
-                        all_articles.add(title)
+            revisions = self._load_revisions()
+            changed = {
+                title: article for title, article in all_articles.items()
+                if not article["revision"] or revisions.get(title) != article["revision"]
+            }
+            logger.info(
+                f"📚 Wikipedia: Found {len(all_articles)} unique articles, "
+                f"{len(all_articles) - len(changed)} unchanged since last run"
+            )
 
-            logger.info(f"📚 Wikipedia: Found {len(all_articles)} unique articles to process")
+            # Look up every candidate's existing scheme in one IN query per block
+            scheme_names = {
+                title: self._extract_scheme_name_from_title(title) for title in changed
+            }
+            existing_ids = self._existing_scheme_ids(
+                [self.generate_slug(name) for name in scheme_names.values() if name]
+            )
 
-            for title in all_articles:
+            for title, article_data in changed.items():
                 try:
-                    article_data = self._get_article(title)
-                    if not article_data:
-                        continue
-
                     content = article_data.get("extract", "")
                     if not content or len(content) < 100:
+                        revisions[title] = article_data["revision"]
                         continue
 
                     # Check if this is scheme-related
                     if not self.contains_scheme_keywords(content):
+                        revisions[title] = article_data["revision"]
                         continue
 
+                    # Only a successful upsert / enrichment marks the revision as
+                    # processed; failed ones are retried next run
+                    processed = True
+
                     # Try to match to existing scheme or create new
-                    scheme_name = self._extract_scheme_name_from_title(title)
+                    scheme_name = scheme_names[title]
                     if scheme_name:
-                        scheme_id = self._try_match_existing(scheme_name)
+                        scheme_id = existing_ids.get(self.generate_slug(scheme_name))
 
                         if scheme_id:
                             # Enrich existing scheme with Wikipedia data
-                            self._enrich_scheme(scheme_id, article_data)
-                            result["schemes_enriched"] += 1
+                            processed = await self._enrich_scheme(scheme_id, article_data)
+                            if processed:
+                                result["schemes_enriched"] += 1
                         else:
                             # Create new scheme from Wikipedia
                             scheme_data = self._parse_article_to_scheme(article_data)
                             if scheme_data:
                                 new_id = self.upsert_scheme(scheme_data)
+                                processed = bool(new_id)
                                 if new_id:
-                                    # Create embeddings
+                                    # Embeddings are batched by the background workers
                                     embed_text = f"{scheme_data['name']}. {scheme_data.get('description', '')}"
-                                    chunks = self.chunk_text(embed_text)
-                                    self.create_and_store_embeddings(
-                                        chunks, new_id,
+                                    await self.queue_embeddings(
+                                        embed_text, new_id,
                                         f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
                                         "Wikipedia"
                                     )
                                     result["schemes_found"] += 1
 
+                    if processed:
+                        revisions[title] = article_data["revision"]
+
                 except Exception as e:
                     logger.warning(f"Failed to process Wikipedia article '{title}': {e}")
 
+            self._save_revisions(revisions)
             result["status"] = "success"
 
         except Exception as e:
@@ -117,97 +181,125 @@ class WikipediaScraper(BaseScraper):
             result["error_message"] = str(e)
             logger.error(f"Wikipedia scraper failed: {e}")
 
+        finally:
+            await self.flush_embeddings()
+
         self.log_scraper_run("wikipedia.org", result["status"], result["schemes_found"])
         return result
 
-    def _search_articles(self, query: str, limit: int = 20) -> list[str]:
-        """Search Wikipedia for articles matching a query."""
+    async def _search_with_articles(self, query: str, limit: int = 20) -> dict[str, dict]:
+        """
+        Search Wikipedia and fetch the matching articles in the same query
+        (generator=search), so each search term costs one request instead of
+        one plus a fetch per result. Returns articles keyed by title.
+        """
+        params = {
+            "action": "query",
+            "generator": "search",
+            "gsrsearch": query,
+            "gsrlimit": limit,
+            "prop": "extracts|info|categories",
+            "exintro": "false",
+            "explaintext": "true",
+            "exlimit": "max",
+            "cllimit": "max",
+            "inprop": "url",
+            "maxlag": self.MAXLAG,
+            "format": "json",
+            "utf8": 1,
+        }
+        pages: dict[str, dict] = {}
         try:
-            params = {
-                "action": "query",
-                "list": "search",
-                "srsearch": query,
-                "srlimit": limit,
-                "format": "json",
-                "utf8": 1,
-            }
-            response = self.fetch_page(f"{self.API_URL}?{'&'.join(f'{k}={v}' for k, v in params.items())}")
-            data = response.json()
-            return [item["title"] for item in data.get("query", {}).get("search", [])]
+            continuation: dict = {}
+            lagged = 0
+            while True:
+                response = await self.async_fetch_page(self.API_URL, params={**params, **continuation})
+                data = response.json()
+
+                if data.get("error", {}).get("code") == "maxlag":
+                    # async_fetch_page has already paused the host for Retry-After
+                    lagged += 1
+                    if lagged > self.MAXLAG_RETRIES:
+                        raise RuntimeError("replication lag persisted, giving up")
+                    continue
+
+                for page_id, page_data in data.get("query", {}).get("pages", {}).items():
+                    page = pages.setdefault(page_id, {
+                        "title": page_data.get("title", ""),
+                        "extract": "",
+                        "url": page_data.get("fullurl", ""),
+                        "revision": page_data.get("lastrevid"),
+                        "categories": [],
+                    })
+                    if page_data.get("extract"):
+                        page["extract"] = page_data["extract"]
+                    page["categories"].extend(
+                        c.get("title", "").replace("Category:", "")
+                        for c in page_data.get("categories", [])
+                    )
+
+                # Continue while extracts/categories are still pending, but
+                # don't page on to further search results
+                continuation = data.get("continue", {})
+                if not set(continuation) - {"continue", "gsroffset"}:
+                    break
+
         except Exception as e:
             logger.warning(f"Wikipedia search failed for '{query}': {e}")
-            return []
 
-    def _get_article(self, title: str) -> Optional[dict]:
-        """Get full article content from Wikipedia."""
+        return {page["title"]: page for page in pages.values()}
+
+    def _load_revisions(self) -> dict[str, int]:
+        """Revision ids recorded by the previous run (empty on first run)."""
         try:
-            params = {
-                "action": "query",
-                "titles": title.replace(" ", "+"),
-                "prop": "extracts|info|categories",
-                "exintro": "false",
-                "explaintext": "true",
-                "exlimit": 1,
-                "inprop": "url",
-                "format": "json",
-                "utf8": 1,
-            }
-            url = f"{self.API_URL}?{'&'.join(f'{k}={v}' for k, v in params.items())}"
-            response = self.fetch_page(url)
-            data = response.json()
-
-            pages = data.get("query", {}).get("pages", {})
-            for page_id, page_data in pages.items():
-                if page_id == "-1":
-                    return None
-                return {
-                    "title": page_data.get("title", ""),
-                    "extract": page_data.get("extract", ""),
-                    "url": page_data.get("fullurl", ""),
-                    "categories": [
-                        c.get("title", "").replace("Category:", "")
-                        for c in page_data.get("categories", [])
-                    ],
-                }
+            return json.loads(self.REVISIONS_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
 
-        except Exception as e:
-            logger.warning(f"Failed to get Wikipedia article '{title}': {e}")
-            return None
+    def _save_revisions(self, revisions: dict[str, int]):
+        try:
+            self.REVISIONS_PATH.write_text(json.dumps(revisions))
+        except OSError as e:
+            logger.warning(f"Could not save Wikipedia revisions: {e}")
 
     def _extract_scheme_name_from_title(self, title: str) -> Optional[str]:
         """Extract scheme name from Wikipedia article title."""
         # Remove disambiguation
-        name = re.sub(r"\s*\(.*?\)\s*$", "", title).strip()
+        name = _DISAMBIG_RE.sub("", title).strip()
         if len(name) < 5:
             return None
         return name
 
-    def _try_match_existing(self, scheme_name: str) -> Optional[str]:
-        """Try to match a scheme name to an existing scheme in DB."""
-        slug = self.generate_slug(scheme_name)
-        try:
-            result = self._client.table("schemes").select("id").eq("slug", slug).execute()
-            if result.data:
-                return result.data[0]["id"]
-        except Exception:
-            pass
-        return None
-
-    def _enrich_scheme(self, scheme_id: str, article_data: dict):
-        """Enrich an existing scheme with Wikipedia data."""
+    def _existing_scheme_ids(self, slugs: list[str]) -> dict[str, str]:
+        """Map slug → id for the slugs that already exist in the DB."""
+        unique = list(dict.fromkeys(slugs))
+        existing: dict[str, str] = {}
+        for start in range(0, len(unique), self.SLUG_LOOKUP_SIZE):
+            try:
+                result = (
+                    self._client.table("schemes")
+                    .select("id, slug")
+                    .in_("slug", unique[start:start + self.SLUG_LOOKUP_SIZE])
+                    .execute()
+                )
+                existing.update((row["slug"], row["id"]) for row in result.data or [])
+            except Exception as e:
+                logger.warning(f"Existing-scheme lookup failed: {e}")
+        return existing
+
+    async def _enrich_scheme(self, scheme_id: str, article_data: dict) -> bool:
+        """Enrich an existing scheme with Wikipedia data. Returns False on failure."""
         try:
             extract = article_data.get("extract", "")
             if not extract:
-                return
+                return True
 
             # Add Wikipedia content as additional embeddings
-            chunks = self.chunk_text(extract)
-            if chunks:
-                self.create_and_store_embeddings(
-                    chunks, scheme_id,
-                    article_data.get("url", ""),
-                    "Wikipedia"
-                )
+            await self.queue_embeddings(
+                extract, scheme_id,
+                article_data.get("url", ""),
+                "Wikipedia"
+            )
 
             # Update the description if current one is short
             existing = (
@@ -224,9 +316,11 @@ class WikipediaScraper(BaseScraper):
                     self._client.table("schemes").update({
                         "description": wiki_desc,
                     }).eq("id", scheme_id).execute()
+            return True
 
         except Exception as e:
             logger.warning(f"Failed to enrich scheme {scheme_id}: {e}")
+            return False
 
     def _parse_article_to_scheme(self, article_data: dict) -> Optional[dict]:
         """Parse Wikipedia article into scheme data format."""
@@ -236,49 +330,18 @@ class WikipediaScraper(BaseScraper):
         if not title or not extract:
             return None
 
-        # Detect state from content
-        state = "Central"
+        # Detect state (first one mentioned) and categories — one scan each over the text
         lower_extract = extract.lower()
-        if "tamil nadu" in lower_extract:
-            state = "Tamil Nadu"
-        elif "kerala" in lower_extract:
-            state = "Kerala"
-        elif "andhra pradesh" in lower_extract:
-            state = "Andhra Pradesh"
-        elif "karnataka" in lower_extract:
-            state = "Karnataka"
-        elif "maharashtra" in lower_extract:
-            state = "Maharashtra"
-        elif "uttar pradesh" in lower_extract:
-            state = "Uttar Pradesh"
-        elif "rajasthan" in lower_extract:
-            state = "Rajasthan"
-
-        # Detect category
-        categories = []
-        cats = article_data.get("categories", [])
-        cat_text = " ".join(cats).lower()
-        if any(w in cat_text for w in ["agriculture", "farming", "rural"]):
-            categories.append("Agriculture")
-        if any(w in cat_text for w in ["education", "scholarship", "school"]):
-            categories.append("Education")
-        if any(w in cat_text for w in ["health", "medical", "hospital"]):
-            categories.append("Health")
-        if any(w in cat_text for w in ["housing", "shelter", "home"]):
-            categories.append("Housing")
-        if any(w in cat_text for w in ["women", "gender", "maternal"]):
-            categories.append("Women")
-        if any(w in cat_text for w in ["employment", "labour", "skill"]):
-            categories.append("Employment")
-        if not categories:
-            categories = ["Government Scheme"]
+        match = _STATE_RE.search(lower_extract)
+        state = _STATE_BY_GROUP[match.lastgroup] if match else "Central"
+
+        cat_text = " ".join(article_data.get("categories", [])).lower()
+        matched = {CATEGORY_KEYWORDS[m.group(0)] for m in _CATEGORY_RE.finditer(cat_text)}
+        categories = [c for c in CATEGORY_ORDER if c in matched] or ["Government Scheme"]
 
         # Extract benefits from text
         benefits = ""
-        benefit_phrases = re.findall(
-            r"(?:provides?|offers?|gives?|benefits?\s+include)\s+(.+?)(?:\.|$)",
-            extract[:1000], re.IGNORECASE
-        )
+        benefit_phrases = _BENEFIT_RE.findall(extract[:1000])
         if benefit_phrases:
             benefits = benefit_phrases[0][:300]
 
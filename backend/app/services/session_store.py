@@ -1,24 +1,36 @@
 """
 Jan-Seva AI — Session Store
-In-memory store for:
+Per-session store for:
 - User profiles (age, income, caste, occupation, state, etc.)
 - Off-topic warning counts
 - Temporary 1-hour blocks for repeat offenders
 
 All state is per session_id (conversation_id or user_id).
-Resets on server restart (upgrade to Redis/Supabase for persistence).
+In-memory by default (resets on restart, not shared between workers).
+With REDIS_URL set, each session is a Redis hash plus a capped chat list,
+shared by all workers and expiring after SESSION_TTL_SECONDS of inactivity.
+The store functions are async so Redis round-trips never block the event loop.
 """
 
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, fields
+from itertools import islice
+
+import orjson
+
+from app.config import get_settings
 from app.utils.logger import logger
 
 
 BLOCK_DURATION_SECONDS = 3600  # 1 hour
 MAX_WARNINGS = 3
+CHAT_HISTORY_LIMIT = 30  # messages kept per session
+SESSION_TTL_SECONDS = 7 * 24 * 3600  # Redis sessions expire after a week idle
+REDIS_TIMEOUT_SECONDS = 2.0  # Connect / read timeout: a stuck Redis fails the call, not the worker
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
     """Holds everything known about a user within a session."""
     # ── Known user profile (filled progressively from conversation) ──
@@ -39,139 +51,222 @@ class UserSession:
     warnings: int = 0
     blocked_until: float = 0.0          # Unix timestamp; 0 = not blocked
     # ── Chat context ──
-    chat_history: list = field(default_factory=list)
+    chat_history: deque = field(default_factory=lambda: deque(maxlen=CHAT_HISTORY_LIMIT))
+
+
+# (UserSession attribute, profile key) in the order get_profile reports them
+_PROFILE_FIELDS = (
+    ("state_name", "state"),
+    ("state_code", "state_code"),
+    ("age", "age"),
+    ("gender", "gender"),
+    ("income_per_year", "income_per_year"),
+    ("caste_category", "caste_category"),
+    ("occupation", "occupation"),
+    ("education", "education"),
+    ("disability", "disability"),
+    ("marital_status", "marital_status"),
+    ("landholding_acres", "landholding_acres"),
+    ("family_size", "family_size"),
+    ("bpl_card", "bpl_card"),
+)
+
+
+# Session attributes persisted in the Redis hash (chat history lives in its own list)
+_HASH_FIELDS = frozenset(f.name for f in fields(UserSession)) - {"chat_history"}
+
+# In-process store: session_id → UserSession (used when REDIS_URL is not set)
+_sessions: dict[str, UserSession] = {}
 
+_redis = None
+
+
+def _redis_client():
+    """Shared asyncio Redis client when REDIS_URL is configured, else None."""
+    global _redis
+    url = get_settings().redis_url
+    if not url:
+        return None
+    if _redis is None:
+        import redis.asyncio as redis
+        _redis = redis.Redis.from_url(
+            url,
+            max_connections=32,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        )
+    return _redis
+
+
+def _key(session_id: str) -> str:
+    return f"jan-seva:session:{session_id}"
 
-# Global store: session_id → UserSession
-_sessions: dict[str, UserSession] = {}
 
+def _chat_key(session_id: str) -> str:
+    return f"jan-seva:session:{session_id}:chat"
 
-def _get_or_create(session_id: str) -> UserSession:
+
+async def _get_or_create(session_id: str) -> UserSession:
+    r = _redis_client()
+    if r is not None:
+        data = await r.hgetall(_key(session_id))
+        return UserSession(**{
+            name: orjson.loads(value)
+            for raw, value in data.items()
+            if (name := raw.decode()) in _HASH_FIELDS
+        })
     if session_id not in _sessions:
         _sessions[session_id] = UserSession()
     return _sessions[session_id]
 
 
+async def _save(session_id: str, changes: dict) -> None:
+    """Persist changed session fields to Redis (in-process sessions are mutated in place)."""
+    r = _redis_client()
+    if r is None or not changes:
+        return
+    key = _key(session_id)
+    async with r.pipeline() as pipe:
+        pipe.hset(key, mapping={name: orjson.dumps(value) for name, value in changes.items()})
+        pipe.expire(key, SESSION_TTL_SECONDS)
+        await pipe.execute()
+
+
 # ──────────────────────────────────────────────────────────────
 # Profile Management
 # ──────────────────────────────────────────────────────────────
 
-def get_profile(session_id: str) -> dict:
+async def get_profile(session_id: str) -> dict:
     """Return known user profile as a dict (only non-None keys)."""
-    session = _get_or_create(session_id)
-    profile = {}
-    if session.state_name:
-        profile["state"] = session.state_name
-    if session.state_code:
-        profile["state_code"] = session.state_code
-    if session.age is not None:
-        profile["age"] = session.age
-    if session.gender:
-        profile["gender"] = session.gender
-    if session.income_per_year is not None:
-        profile["income_per_year"] = session.income_per_year
-    if session.caste_category:
-        profile["caste_category"] = session.caste_category
-    if session.occupation:
-        profile["occupation"] = session.occupation
-    if session.education:
-        profile["education"] = session.education
-    if session.disability:
-        profile["disability"] = session.disability
-    if session.marital_status:
-        profile["marital_status"] = session.marital_status
-    if session.landholding_acres is not None:
-        profile["landholding_acres"] = session.landholding_acres
-    if session.family_size is not None:
-        profile["family_size"] = session.family_size
-    if session.bpl_card is not None:
-        profile["bpl_card"] = session.bpl_card
-    return profile
-
-
-def update_profile(session_id: str, updates: dict) -> None:
+    session = await _get_or_create(session_id)
+    return {
+        key: value
+        for attr, key in _PROFILE_FIELDS
+        if (value := getattr(session, attr)) is not None and value != ""
+    }
+
+
+async def update_profile(session_id: str, updates: dict) -> None:
     """Merge new profile data into existing session."""
-    session = _get_or_create(session_id)
-    for key, value in updates.items():
-        if value is not None and hasattr(session, key):
-            setattr(session, key, value)
+    session = await _get_or_create(session_id)
+    changes = {
+        key: value for key, value in updates.items()
+        if value is not None and key in _HASH_FIELDS
+    }
+    for key, value in changes.items():
+        setattr(session, key, value)
+    await _save(session_id, changes)
     logger.debug(f"👤 Profile updated for {session_id}: {updates}")
 
 
-def set_state_from_ip(session_id: str, state_info: dict | None) -> None:
+async def set_state_from_ip(session_id: str, state_info: dict | None) -> None:
     """Set state from IP resolution (only if user hasn't set it themselves)."""
     if not state_info:
         return
-    session = _get_or_create(session_id)
+    session = await _get_or_create(session_id)
     # Don't overwrite if explicitly set by user
     if session.state_code is None:
         session.state_code = state_info.get("code")
         session.state_name = state_info.get("name")
+        await _save(session_id, {"state_code": session.state_code, "state_name": session.state_name})
 
 
 # ──────────────────────────────────────────────────────────────
 # Chat History
 # ──────────────────────────────────────────────────────────────
 
-def get_chat_history(session_id: str, last_n: int = 8) -> list:
+async def get_chat_history(session_id: str, last_n: int = 8) -> list:
     """Return recent chat history for LLM context."""
-    session = _get_or_create(session_id)
-    return session.chat_history[-last_n:]
+    if last_n <= 0:
+        return []
+    r = _redis_client()
+    if r is not None:
+        return [orjson.loads(item) for item in await r.lrange(_chat_key(session_id), -last_n, -1)]
+    history = (await _get_or_create(session_id)).chat_history
+    return list(islice(history, max(0, len(history) - last_n), None))
 
 
-def append_chat(session_id: str, role: str, content: str) -> None:
+async def append_chat(session_id: str, role: str, content: str) -> None:
     """Append a message to the session's chat history."""
-    session = _get_or_create(session_id)
-    session.chat_history.append({"role": role, "content": content})
-    # Keep only last 30 messages
-    if len(session.chat_history) > 30:
-        session.chat_history = session.chat_history[-30:]
+    message = {"role": role, "content": content}
+    r = _redis_client()
+    if r is not None:
+        key = _chat_key(session_id)
+        async with r.pipeline() as pipe:
+            pipe.rpush(key, orjson.dumps(message))
+            pipe.ltrim(key, -CHAT_HISTORY_LIMIT, -1)
+            pipe.expire(key, SESSION_TTL_SECONDS)
+            await pipe.execute()
+        return
+    # The deque drops the oldest message once CHAT_HISTORY_LIMIT is reached
+    (await _get_or_create(session_id)).chat_history.append(message)
 
 
 # ──────────────────────────────────────────────────────────────
 # Warning & Block System
 # ──────────────────────────────────────────────────────────────
 
-def is_blocked(session_id: str) -> tuple[bool, float]:
+async def is_blocked(session_id: str) -> tuple[bool, float]:
     """
     Returns (is_blocked, seconds_remaining).
     Automatically clears expired blocks.
     """
-    session = _get_or_create(session_id)
-    if session.blocked_until == 0:
+    r = _redis_client()
+    if r is not None:
+        raw = await r.hget(_key(session_id), "blocked_until")
+        blocked_until = orjson.loads(raw) if raw else 0.0
+    else:
+        blocked_until = (await _get_or_create(session_id)).blocked_until
+    if blocked_until == 0:
         return False, 0.0
-    remaining = session.blocked_until - time.time()
+    remaining = blocked_until - time.time()
     if remaining <= 0:
         # Block expired — reset
-        session.blocked_until = 0.0
-        session.warnings = 0
+        if r is None:
+            session = _sessions[session_id]
+            session.blocked_until = 0.0
+            session.warnings = 0
+        await _save(session_id, {"blocked_until": 0.0, "warnings": 0})
         logger.info(f"🔓 Block expired for session {session_id}")
         return False, 0.0
     return True, remaining
 
 
-def issue_warning(session_id: str) -> tuple[int, bool]:
+async def issue_warning(session_id: str) -> tuple[int, bool]:
     """
     Issue an off-topic warning. Returns (warning_number, is_now_blocked).
     At MAX_WARNINGS, applies a 1-hour block.
     """
-    session = _get_or_create(session_id)
-    session.warnings += 1
-    warning_num = session.warnings
+    r = _redis_client()
+    if r is not None:
+        # HINCRBY keeps the count right when several workers warn the same session
+        warning_num = await r.hincrby(_key(session_id), "warnings", 1)
+    else:
+        session = await _get_or_create(session_id)
+        session.warnings += 1
+        warning_num = session.warnings
 
     if warning_num >= MAX_WARNINGS:
-        session.blocked_until = time.time() + BLOCK_DURATION_SECONDS
+        blocked_until = time.time() + BLOCK_DURATION_SECONDS
+        if r is None:
+            session.blocked_until = blocked_until
+        await _save(session_id, {"blocked_until": blocked_until})
         logger.warning(f"🚫 Session {session_id} BLOCKED for 1 hour (3 off-topic warnings)")
         return warning_num, True
 
+    if r is not None:
+        await r.expire(_key(session_id), SESSION_TTL_SECONDS)
     logger.info(f"⚠️ Warning {warning_num}/{MAX_WARNINGS} issued to session {session_id}")
     return warning_num, False
 
 
-def get_warning_count(session_id: str) -> int:
-    return _get_or_create(session_id).warnings
+async def get_warning_count(session_id: str) -> int:
+    return (await _get_or_create(session_id)).warnings
 
 
-def clear_session(session_id: str) -> None:
+async def clear_session(session_id: str) -> None:
     """Remove a session entirely (for testing or admin tools)."""
+    r = _redis_client()
+    if r is not None:
+        await r.delete(_key(session_id), _chat_key(session_id))
     _sessions.pop(session_id, None)
@@ -13,6 +13,12 @@ import re
 from enum import Enum
 from app.utils.logger import logger
 
+try:
+    # google-re2: linear-time automaton matching, immune to catastrophic backtracking
+    import re2 as _pattern_engine
+except ImportError:
+    _pattern_engine = re
+
 
 class TopicVerdict(str, Enum):
     ALLOWED = "allowed"
@@ -22,7 +28,7 @@ class TopicVerdict(str, Enum):
 
 # ── On-Topic Keywords (scheme / citizen welfare domain) ──────────────────────
 # If ANY of these appear in the query, it is definitely on-topic.
-ON_TOPIC_KEYWORDS = {
+ON_TOPIC_KEYWORDS = frozenset({
     # Core scheme vocabulary
     "scheme", "yojana", "subsidy", "benefit", "pension", "scholarship",
     "stipend", "grant", "allowance", "welfare", "assistance", "relief",
@@ -69,7 +75,7 @@ ON_TOPIC_KEYWORDS = {
     # Question words that typically precede scheme queries
     "how much", "when will", "where to", "what is the", "can i get",
     "am i eligible", "who can apply", "what documents",
-}
+})
 
 # Partial phrase patterns that indicate on-topic (regex)
 ON_TOPIC_PATTERNS = [
@@ -86,7 +92,7 @@ ON_TOPIC_PATTERNS = [
 
 # ── Off-Topic Keywords (entertainment, sports, politics, general knowledge) ───
 # These categories should NOT be answered.
-OFF_TOPIC_KEYWORDS = {
+OFF_TOPIC_KEYWORDS = frozenset({
     # Sports
     "cricket", "ipl", "football", "hockey", "tennis", "badminton",
     "match", "score", "wicket", "century", "world cup", "fifa",
@@ -108,7 +114,7 @@ OFF_TOPIC_KEYWORDS = {
     "divorce advice", "relationship",
     # Gaming
     "pubg", "free fire", "fortnite", "minecraft", "gta",
-}
+})
 
 # ── Hard Block patterns (abusive / prompt injection) ──────────────────────────
 HARD_BLOCK_PATTERNS = [
@@ -119,17 +125,43 @@ HARD_BLOCK_PATTERNS = [
     r"act\s+as\s+(if\s+you\s+are\s+)?(an?\s+)?(evil|unrestricted|jailbroken)",
 ]
 
+# Compiled once at import — classify() runs on every user turn. Both sets are
+# plain alternations (no backreferences/lookarounds), so RE2 accepts them as-is;
+# the inline (?i) flag works the same in either engine.
+_HARD_BLOCK_RE = _pattern_engine.compile("(?i)" + "|".join(HARD_BLOCK_PATTERNS))
+_ON_TOPIC_PATTERN_RE = _pattern_engine.compile("(?i)" + "|".join(ON_TOPIC_PATTERNS))
+_TOKEN_SPLIT_RE = re.compile(r"\W+")
+
+
+def _split_keywords(keywords: frozenset[str]):
+    """
+    Single-word keywords are matched by set intersection with the query's
+    tokens; multi-word / hyphenated ones ("pm kisan", "e-shram") can never
+    be a single token, so they go into one word-bounded alternation instead.
+    """
+    words = frozenset(k for k in keywords if re.fullmatch(r"\w+", k))
+    phrases = sorted(keywords - words, key=len, reverse=True)
+    phrase_re = _pattern_engine.compile(r"\b(?:" + "|".join(map(re.escape, phrases)) + r")\b")
+    return words, phrase_re
+
+
+# Generic question openers from ON_TOPIC_KEYWORDS: they open off-topic questions
+# just as often ("how much did the movie earn"), so they must not outvote an
+# off-topic hit
+_QUESTION_OPENERS = frozenset({
+    "how much", "when will", "where to", "what is the", "can i get", "how to get",
+})
+
+_ON_TOPIC_WORDS, _ON_TOPIC_PHRASE_RE = _split_keywords(ON_TOPIC_KEYWORDS - _QUESTION_OPENERS)
+_OFF_TOPIC_WORDS, _OFF_TOPIC_PHRASE_RE = _split_keywords(OFF_TOPIC_KEYWORDS)
+
 
 class TopicGuard:
     """Fast, rule-based topic classification for Jan-Seva AI."""
 
     def __init__(self):
-        self._hard_block_re = re.compile(
-            "|".join(HARD_BLOCK_PATTERNS), re.IGNORECASE
-        )
-        self._on_topic_pattern_re = re.compile(
-            "|".join(ON_TOPIC_PATTERNS), re.IGNORECASE
-        )
+        self._hard_block_re = _HARD_BLOCK_RE
+        self._on_topic_pattern_re = _ON_TOPIC_PATTERN_RE
 
     def classify(self, query: str) -> TopicVerdict:
         """
@@ -137,33 +169,37 @@ class TopicGuard:
         Fast — no API calls.
         """
         normalized = query.lower().strip()
+        if not normalized:
+            return TopicVerdict.ALLOWED
 
-        # 1. Hard block check (abusive content, prompt injection)
+        # 1. Hard block check (abusive content, prompt injection) — always first,
+        # so an on-topic word can't smuggle an injection through
         if self._hard_block_re.search(normalized):
             logger.warning(f"🚫 TopicGuard: HARD BLOCK — '{query[:60]}'")
             return TopicVerdict.BLOCK
 
-        # 2. On-topic keyword check
-        words = set(re.findall(r"\b\w+\b", normalized))
-        if words & ON_TOPIC_KEYWORDS:
+        # 2. Short queries (≤ 4 words) — likely context follow-ups or greetings
+        # Allow them through (they'll hit the greeting handler or be ambiguous)
+        if len(normalized.split()) <= 4:
             return TopicVerdict.ALLOWED
 
-        # 3. On-topic pattern check
-        if self._on_topic_pattern_re.search(normalized):
+        # 3. Only an off-topic hit can produce WARN, so most queries stop here
+        # without running the on-topic checks at all
+        words = frozenset(w for w in _TOKEN_SPLIT_RE.split(normalized) if w)
+        if not (words & _OFF_TOPIC_WORDS or _OFF_TOPIC_PHRASE_RE.search(normalized)):
             return TopicVerdict.ALLOWED
 
-        # 4. Short queries (≤ 4 words) — likely context follow-ups or greetings
-        # Allow them through (they'll hit the greeting handler or be ambiguous)
-        if len(normalized.split()) <= 4:
+        # 4. Off-topic words present — an on-topic keyword or pattern still wins
+        # (better to be permissive than block a valid scheme query)
+        if (
+            words & _ON_TOPIC_WORDS
+            or _ON_TOPIC_PHRASE_RE.search(normalized)
+            or self._on_topic_pattern_re.search(normalized)
+        ):
             return TopicVerdict.ALLOWED
 
-        # 5. Off-topic keyword check
-        if words & OFF_TOPIC_KEYWORDS:
-            logger.info(f"⚠️ TopicGuard: OFF-TOPIC — '{query[:60]}'")
-            return TopicVerdict.WARN
-
-        # 6. Default: allow (better to be permissive than block a valid scheme query)
-        return TopicVerdict.ALLOWED
+        logger.info(f"⚠️ TopicGuard: OFF-TOPIC — '{query[:60]}'")
+        return TopicVerdict.WARN
 
 
 # ── Response Templates ────────────────────────────────────────────────────────
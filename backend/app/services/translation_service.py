@@ -4,8 +4,14 @@ Uses AI4Bharat's IndicTrans2 (free, unlimited, purpose-built for Indian language
 Lazy-loads the model to avoid startup overhead, with Google Translate as fallback.
 """
 
+import asyncio
 import json
 import os
+import re
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from app.config import get_settings
 from app.utils.logger import logger
 
 
@@ -66,19 +72,45 @@ INDIAN_LANGUAGES = {
 }
 
 
+# Sentences of different lengths for tracing / checking the TorchScript encoder
+_TRACE_SAMPLES = {
+    "eng_Latn": [
+        "How do I apply for this scheme?",
+        "Farmers with less than two hectares of land can receive six thousand rupees every year.",
+    ],
+    "hin_Deva": [
+        "मैं इस योजना के लिए आवेदन कैसे करूं?",
+        "दो हेक्टेयर से कम भूमि वाले किसानों को हर साल छह हजार रुपये मिल सकते हैं।",
+    ],
+}
+
+
+def _max_new_tokens(source_len: int) -> int:
+    """Output budget: translations rarely run past twice the source length (+ slack for short inputs)."""
+    return min(256, 2 * source_len + 16)
+
+
 class IndicTransEngine:
     """
     AI4Bharat IndicTrans2 engine — lazy-loaded for zero startup cost.
     Uses the distilled 200M model for fast CPU inference.
     """
 
+    MAX_BATCH_SIZE = 16  # sentences per generate() call in translate_batch
+
     def __init__(self):
         self._en_indic_model = None
         self._en_indic_tokenizer = None
         self._indic_en_model = None
         self._indic_en_tokenizer = None
         self._processor = None
+        self._traced_encoders: dict[int, object] = {}  # id(model) → TorchScript encoder
+        self._cpu_autocast: set[int] = set()  # id(model) of CPU models run under bf16 autocast
         self._available = None  # None = not checked, True/False = checked
+        # IndicProcessor hands placeholder maps from preprocess to postprocess through
+        # one internal FIFO, so a preprocess → postprocess run must not interleave
+        # with another thread's (translate_async batches run in worker threads)
+        self._pipeline_lock = threading.Lock()
 
     def is_available(self) -> bool:
         """Check if IndicTrans2 dependencies are installed."""
@@ -105,13 +137,19 @@ class IndicTransEngine:
             self._en_indic_tokenizer = AutoTokenizer.from_pretrained(
                 model_name, trust_remote_code=True
             )
-            self._en_indic_model = AutoModelForSeq2SeqLM.from_pretrained(
-                model_name, trust_remote_code=True
-            )
             # Use CPU by default — GPU if available
             device = "cuda" if torch.cuda.is_available() else "cpu"
-            self._en_indic_model = self._en_indic_model.to(device)
-            self._en_indic_model.eval()
+            self._en_indic_model = self._load_ct2("en-indic", device)
+            if self._en_indic_model is None:
+                self._en_indic_model = AutoModelForSeq2SeqLM.from_pretrained(
+                    model_name, trust_remote_code=True
+                )
+                self._en_indic_model = self._apply_dtype(self._en_indic_model.to(device), device)
+                self._en_indic_model.eval()
+                self._trace_encoder(
+                    self._en_indic_model, self._en_indic_tokenizer,
+                    "eng_Latn", "hin_Deva", _TRACE_SAMPLES["eng_Latn"],
+                )
             logger.info(f"✅ IndicTrans2 En→Indic loaded on {device}")
 
         return self._en_indic_model, self._en_indic_tokenizer
@@ -128,16 +166,117 @@ class IndicTransEngine:
             self._indic_en_tokenizer = AutoTokenizer.from_pretrained(
                 model_name, trust_remote_code=True
             )
-            self._indic_en_model = AutoModelForSeq2SeqLM.from_pretrained(
-                model_name, trust_remote_code=True
-            )
             device = "cuda" if torch.cuda.is_available() else "cpu"
-            self._indic_en_model = self._indic_en_model.to(device)
-            self._indic_en_model.eval()
+            self._indic_en_model = self._load_ct2("indic-en", device)
+            if self._indic_en_model is None:
+                self._indic_en_model = AutoModelForSeq2SeqLM.from_pretrained(
+                    model_name, trust_remote_code=True
+                )
+                self._indic_en_model = self._apply_dtype(self._indic_en_model.to(device), device)
+                self._indic_en_model.eval()
+                self._trace_encoder(
+                    self._indic_en_model, self._indic_en_tokenizer,
+                    "hin_Deva", "eng_Latn", _TRACE_SAMPLES["hin_Deva"],
+                )
             logger.info(f"✅ IndicTrans2 Indic→En loaded on {device}")
 
         return self._indic_en_model, self._indic_en_tokenizer
 
+    def _load_ct2(self, direction: str, device: str):
+        """
+        Load a CTranslate2 int8 conversion of the model if one is configured, e.g.
+          ct2-transformers-converter --model ai4bharat/indictrans2-en-indic-dist-200M \\
+            --trust_remote_code --quantization int8 --output_dir <TRANSLATION_CT2_DIR>/en-indic
+        Returns None (use the HuggingFace model) when unset, missing or not installed.
+        """
+        ct2_dir = get_settings().translation_ct2_dir
+        if not ct2_dir:
+            return None
+        path = os.path.join(ct2_dir, direction)
+        try:
+            import ctranslate2
+
+            translator = ctranslate2.Translator(
+                path, device=device, compute_type="int8", intra_threads=os.cpu_count() or 0
+            )
+            logger.info(f"⚡ Using CTranslate2 int8 model: {path}")
+            return translator
+        except (ImportError, RuntimeError, ValueError) as e:
+            logger.warning(f"⚠️ CTranslate2 model unavailable ({path}): {e} — using HuggingFace model")
+            return None
+
+    def _apply_dtype(self, model, device: str):
+        """
+        Half precision per TRANSLATION_DTYPE: on CUDA the weights are cast
+        (float16/bfloat16); on CPU bfloat16 runs generate() under autocast,
+        which pays off on hosts with native bf16 (AVX-512 BF16 / AMX).
+        """
+        import torch
+
+        dtype = get_settings().translation_dtype
+        if dtype not in ("float16", "bfloat16"):
+            return model
+        if device == "cuda":
+            return model.to(getattr(torch, dtype))
+        if dtype == "bfloat16":
+            self._cpu_autocast.add(id(model))
+        else:
+            logger.warning("⚠️ float16 translation needs CUDA — keeping float32 on CPU")
+        return model
+
+    def _trace_encoder(self, model, tokenizer, src_flores: str, tgt_flores: str, samples: list[str]):
+        """
+        With TRANSLATION_TORCHSCRIPT on, trace the model's encoder and optimize it
+        for inference; generate() then gets precomputed encoder_outputs and only
+        the decoder runs eagerly. The trace is checked against eager mode on a
+        second input of a different length and discarded on any mismatch.
+        """
+        if not get_settings().translation_torchscript or id(model) in self._cpu_autocast:
+            return
+        import torch
+
+        class EncoderHidden(torch.nn.Module):
+            def __init__(self, encoder):
+                super().__init__()
+                self.encoder = encoder
+
+            def forward(self, input_ids, attention_mask):
+                return self.encoder(
+                    input_ids=input_ids, attention_mask=attention_mask, return_dict=False
+                )[0]
+
+        try:
+            eager = EncoderHidden(model.get_encoder()).eval()
+            device = next(model.parameters()).device
+            trace_in, check_in = self._trace_inputs(tokenizer, device, src_flores, tgt_flores, samples)
+            with torch.no_grad():
+                traced = torch.jit.optimize_for_inference(
+                    torch.jit.trace(eager, (trace_in["input_ids"], trace_in["attention_mask"]))
+                )
+                args = (check_in["input_ids"], check_in["attention_mask"])
+                if not torch.allclose(traced(*args), eager(*args), atol=1e-4):
+                    raise RuntimeError("traced encoder does not match eager output")
+            self._traced_encoders[id(model)] = traced
+            logger.info("⚡ IndicTrans2 encoder compiled with TorchScript")
+        except Exception as e:
+            logger.warning(f"⚠️ TorchScript encoder unavailable, using eager mode: {e}")
+
+    def _trace_inputs(self, tokenizer, device, src_flores: str, tgt_flores: str, samples: list[str]) -> list:
+        """
+        Tokenized tensors for the trace samples. Nothing is postprocessed here,
+        so each sample's placeholder map is popped straight away — left queued,
+        later translations would restore another call's numbers / URLs.
+        """
+        ip = self._get_processor()
+        inputs = []
+        for text in samples:
+            batch = ip.preprocess_batch([text], src_lang=src_flores, tgt_lang=tgt_flores)
+            try:
+                inputs.append(tokenizer(batch, return_tensors="pt").to(device))
+            finally:
+                self._discard_placeholders(ip, len(batch), tgt_flores)
+        return inputs
+
     def _get_processor(self):
         """Get IndicProcessor for pre/post processing."""
         if self._processor is None:
@@ -145,87 +284,179 @@ class IndicTransEngine:
             self._processor = IndicProcessor(inference=True)
         return self._processor
 
+    @staticmethod
+    def _discard_placeholders(ip, count: int, lang: str):
+        """Pop the placeholder maps queued by a preprocess whose generate() failed."""
+        ip.postprocess_batch([""] * count, lang=lang)
+
+    def _generate(self, model, tokenizer, batch: list[str]) -> list[str]:
+        """Beam-search translate preprocessed sentences; returns decoded (not postprocessed) text."""
+        beam_size = get_settings().indic_beam_size
+        if type(model).__module__.startswith("ctranslate2"):
+            # CTranslate2 works on token strings: tokenize with the HF tokenizer,
+            # translate, then map the best hypothesis back to ids for decoding
+            source_ids = tokenizer(batch, truncation=True, max_length=256)["input_ids"]
+            results = model.translate_batch(
+                [tokenizer.convert_ids_to_tokens(ids) for ids in source_ids],
+                beam_size=beam_size,
+                max_batch_size=32,
+                max_decoding_length=_max_new_tokens(max(map(len, source_ids), default=0)),
+            )
+            with tokenizer.as_target_tokenizer():
+                outputs = [tokenizer.convert_tokens_to_ids(r.hypotheses[0]) for r in results]
+        else:
+            import torch
+
+            device = next(model.parameters()).device
+            inputs = tokenizer(
+                batch, truncation=True, padding="longest",
+                max_length=256, return_tensors="pt"
+            ).to(device)
+
+            encoder = self._traced_encoders.get(id(model))
+            autocast = torch.autocast("cpu", dtype=torch.bfloat16, enabled=id(model) in self._cpu_autocast)
+            with torch.no_grad(), autocast:
+                extra = {}
+                if encoder is not None:
+                    from transformers.modeling_outputs import BaseModelOutput
+                    extra["encoder_outputs"] = BaseModelOutput(
+                        last_hidden_state=encoder(inputs["input_ids"], inputs["attention_mask"])
+                    )
+                outputs = model.generate(
+                    **inputs,
+                    **extra,
+                    num_beams=beam_size,
+                    early_stopping=True,
+                    max_new_tokens=_max_new_tokens(inputs["input_ids"].shape[1]),
+                    use_cache=True,
+                )
+
+        # IndicTrans2 keeps separate source / target vocabularies; output ids
+        # belong to the target one, so decoding must run in target mode
+        with tokenizer.as_target_tokenizer():
+            return tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
     def translate(self, text: str, src_lang: str, tgt_lang: str) -> str:
         """Translate text using IndicTrans2."""
-        import torch
-
         src_flores = LANG_TO_FLORES.get(src_lang)
         tgt_flores = LANG_TO_FLORES.get(tgt_lang)
 
         if not src_flores or not tgt_flores:
             raise ValueError(f"Unsupported language pair: {src_lang} → {tgt_lang}")
 
-        ip = self._get_processor()
+        with self._pipeline_lock:
+            ip = self._get_processor()
 
-        # Determine direction and load appropriate model
-        if src_lang == "en":
-            model, tokenizer = self._load_en_indic()
-        else:
-            model, tokenizer = self._load_indic_en()
-
-        # Preprocess
-        batch = ip.preprocess_batch([text], src_lang=src_flores, tgt_lang=tgt_flores)
-
-        # Tokenize
-        device = next(model.parameters()).device
-        inputs = tokenizer(
-            batch, truncation=True, padding="longest",
-            max_length=256, return_tensors="pt"
-        ).to(device)
-
-        # Generate
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                num_beams=5,
-                num_return_sequences=1,
-                max_length=256,
-            )
+            # Determine direction and load appropriate model
+            if src_lang == "en":
+                model, tokenizer = self._load_en_indic()
+            else:
+                model, tokenizer = self._load_indic_en()
 
-        # Decode
-        with tokenizer.as_target_tokenizer():
-            decoded = tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            # Preprocess
+            batch = ip.preprocess_batch([text], src_lang=src_flores, tgt_lang=tgt_flores)
 
-        # Postprocess
-        result = ip.postprocess_batch(decoded, lang=tgt_flores)
-        return result[0] if result else text
+            try:
+                decoded = self._generate(model, tokenizer, batch)
+            except Exception:
+                self._discard_placeholders(ip, len(batch), tgt_flores)
+                raise
+
+            # Postprocess
+            result = ip.postprocess_batch(decoded, lang=tgt_flores)
+            return result[0] if result else text
 
     def translate_batch(self, texts: list[str], src_lang: str, tgt_lang: str) -> list[str]:
         """Translate a batch of texts using IndicTrans2."""
-        import torch
-
         src_flores = LANG_TO_FLORES.get(src_lang)
         tgt_flores = LANG_TO_FLORES.get(tgt_lang)
 
         if not src_flores or not tgt_flores:
             return texts
 
-        ip = self._get_processor()
+        with self._pipeline_lock:
+            ip = self._get_processor()
 
-        if src_lang == "en":
-            model, tokenizer = self._load_en_indic()
-        else:
-            model, tokenizer = self._load_indic_en()
+            if src_lang == "en":
+                model, tokenizer = self._load_en_indic()
+            else:
+                model, tokenizer = self._load_indic_en()
 
-        # Preprocess
-        batch = ip.preprocess_batch(texts, src_lang=src_flores, tgt_lang=tgt_flores)
+            # Translate each distinct text once; positions maps inputs back to it
+            uniq: dict[str, int] = {}
+            positions = [uniq.setdefault(text, len(uniq)) for text in texts]
 
-        device = next(model.parameters()).device
-        inputs = tokenizer(
-            batch, truncation=True, padding="longest",
-            max_length=256, return_tensors="pt"
-        ).to(device)
+            # Preprocess
+            batch = ip.preprocess_batch(list(uniq), src_lang=src_flores, tgt_lang=tgt_flores)
 
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs, num_beams=5, num_return_sequences=1, max_length=256,
-            )
+            # Translate in windows of similar-length sentences so little of each
+            # padded batch is padding, then restore the original order
+            order = sorted(range(len(batch)), key=lambda i: len(batch[i]))
+            decoded = [""] * len(batch)
+            try:
+                for start in range(0, len(order), self.MAX_BATCH_SIZE):
+                    window = order[start:start + self.MAX_BATCH_SIZE]
+                    for i, text in zip(window, self._generate(model, tokenizer, [batch[i] for i in window])):
+                        decoded[i] = text
+            except Exception:
+                self._discard_placeholders(ip, len(batch), tgt_flores)
+                raise
 
-        with tokenizer.as_target_tokenizer():
-            decoded = tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            # Postprocessing restores placeholders in preprocess order
+            uniq_out = ip.postprocess_batch(decoded, lang=tgt_flores)
+            return [uniq_out[p] for p in positions]
 
-        result = ip.postprocess_batch(decoded, lang=tgt_flores)
-        return result
+
+class _TranslationBatcher:
+    """
+    Dynamic batching for concurrent requests: single texts submitted within a
+    short window (or until MAX_BATCH queue up) for the same language pair are
+    translated by one translate_batch call in a worker thread.
+    """
+
+    WINDOW_SECONDS = 0.01
+    MAX_BATCH = 16
+
+    def __init__(self, translate_batch):
+        self._translate_batch = translate_batch
+        self._pending: dict[tuple[str, str], list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[tuple[str, str], asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, text: str, source: str, target: str) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (source, target)
+        queue = self._pending.setdefault(key, [])
+        queue.append((text, future))
+
+        if len(queue) >= self.MAX_BATCH:
+            self._flush(key)
+        elif len(queue) == 1:
+            self._timers[key] = loop.call_later(self.WINDOW_SECONDS, self._flush, key)
+        return await future
+
+    def _flush(self, key: tuple[str, str]):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._run(key, batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, key: tuple[str, str], batch: list[tuple[str, asyncio.Future]]):
+        try:
+            results = await asyncio.to_thread(self._translate_batch, [text for text, _ in batch], *key)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
 
 
 class TranslationService:
@@ -234,6 +465,8 @@ class TranslationService:
     Applies glossary post-processing to fix government/legal terminology.
     """
 
+    CACHE_SIZE = 4096  # translated segments kept for hot phrases (greetings, scheme names)
+
     def __init__(self):
         # Load glossary
         glossary_path = os.path.join(
@@ -248,9 +481,23 @@ class TranslationService:
                 f"terms across {len(self._glossary)} languages"
             )
 
+        # One alternation per language, longest term first so "government scheme"
+        # wins over "scheme" at the same position
+        self._glossary_re = {
+            lang: re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))))
+            for lang, terms in self._glossary.items()
+            if terms
+        }
+
         # IndicTrans2 engine (lazy-loaded)
         self._indic = IndicTransEngine()
 
+        # Finished translations (model + glossary), LRU-evicted
+        self._cache: OrderedDict[tuple[str, str, bytes], str] = OrderedDict()
+
+        # Coalesces concurrent translate_async() misses into IndicTrans2 batches
+        self._batcher = _TranslationBatcher(self.translate_batch)
+
     def translate(self, text: str, source: str = "en", target: str = "hi") -> str:
         """
         Translate text:
@@ -261,6 +508,11 @@ class TranslationService:
         if source == target:
             return text
 
+        key = self._cache_key(text, source, target)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         translated = None
 
         # --- Strategy 1: IndicTrans2 (AI4Bharat) ---
@@ -286,10 +538,30 @@ class TranslationService:
                 return text
 
         # --- Step 3: Apply glossary corrections ---
-        lang_glossary = self._glossary.get(target, {})
-        for wrong_term, correct_term in lang_glossary.items():
-            translated = translated.replace(wrong_term, correct_term)
+        translated = self._apply_glossary(translated, target)
 
+        self._cache_put(key, translated)
+        return translated
+
+    async def translate_async(self, text: str, source: str = "en", target: str = "hi") -> str:
+        """
+        translate() for request handlers: cache hits return at once, misses from
+        concurrent requests are coalesced into one IndicTrans2 batch off the event loop.
+        """
+        if source == target:
+            return text
+
+        key = self._cache_key(text, source, target)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if not self._indic.is_available():
+            return await asyncio.to_thread(self.translate, text, source, target)
+
+        translated = await self._batcher.submit(text, source, target)
+        if translated != text:  # unchanged text = every backend failed; don't pin it
+            self._cache_put(key, translated)
         return translated
 
     def translate_batch(self, texts: list[str], source: str = "en", target: str = "hi") -> list[str]:
@@ -301,19 +573,36 @@ class TranslationService:
         if self._indic.is_available():
             try:
                 results = self._indic.translate_batch(texts, source, target)
-                # Apply glossary to each
-                lang_glossary = self._glossary.get(target, {})
-                if lang_glossary:
-                    for i, text in enumerate(results):
-                        for wrong, correct in lang_glossary.items():
-                            results[i] = results[i].replace(wrong, correct)
-                return results
+                return [self._apply_glossary(text, target) for text in results]
             except Exception as e:
                 logger.warning(f"⚠️ IndicTrans2 batch failed: {e}")
 
         # Fallback: individual Google Translate
         return [self.translate(t, source, target) for t in texts]
 
+    @staticmethod
+    def _cache_key(text: str, source: str, target: str) -> tuple[str, str, bytes]:
+        return (source, target, blake2b(text.encode(), digest_size=8).digest())
+
+    def _cache_get(self, key: tuple[str, str, bytes]) -> str | None:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: tuple[str, str, bytes], translated: str):
+        self._cache[key] = translated
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _apply_glossary(self, text: str, target: str) -> str:
+        """Fix government/legal terms in a single scan of the text."""
+        pattern = self._glossary_re.get(target)
+        if pattern is None:
+            return text
+        terms = self._glossary[target]
+        return pattern.sub(lambda m: terms[m.group()], text)
+
     def detect_language(self, text: str) -> str:
         """Detect the language of input text."""
         try:
@@ -4,12 +4,43 @@ Whisper (STT) + Edge-TTS (TTS) for all major Indian languages.
 All free, no paid APIs.
 """
 
+import io
 import tempfile
 import os
+from types import MappingProxyType
+from typing import AsyncIterator
 import edge_tts
 from app.utils.logger import logger
 
 
+# Language code → Edge-TTS voice name (Indian variants)
+_VOICE_MAP = MappingProxyType({
+    # --- Major Indian Languages ---
+    "en": "en-IN-NeerjaNeural",        # Indian English (Female)
+    "hi": "hi-IN-SwaraNeural",          # Hindi (Female)
+    "ta": "ta-IN-PallaviNeural",        # Tamil (Female)
+    "te": "te-IN-ShrutiNeural",         # Telugu (Female)
+    "kn": "kn-IN-SapnaNeural",          # Kannada (Female)
+    "ml": "ml-IN-SobhanaNeural",        # Malayalam (Female)
+    "bn": "bn-IN-TanishaaNeural",       # Bengali (Female)
+    "mr": "mr-IN-AarohiNeural",         # Marathi (Female)
+    "gu": "gu-IN-DhwaniNeural",         # Gujarati (Female)
+    "pa": "pa-IN-GurpreetNeural",       # Punjabi (Male — only option)
+    "ur": "ur-IN-GulNeural",            # Urdu (Female)
+    # --- Male alternatives ---
+    "en-m": "en-IN-PrabhatNeural",      # Indian English (Male)
+    "hi-m": "hi-IN-MadhurNeural",       # Hindi (Male)
+    "ta-m": "ta-IN-ValluvarNeural",     # Tamil (Male)
+    "te-m": "te-IN-MohanNeural",        # Telugu (Male)
+    "kn-m": "kn-IN-GaganNeural",        # Kannada (Male)
+    "ml-m": "ml-IN-MidhunNeural",       # Malayalam (Male)
+    "bn-m": "bn-IN-BashkarNeural",      # Bengali (Male)
+    "mr-m": "mr-IN-ManoharNeural",      # Marathi (Male)
+    "gu-m": "gu-IN-NiranjanNeural",     # Gujarati (Male)
+    "ur-m": "ur-IN-SalmanNeural",       # Urdu (Male)
+})
+
+
 class VoiceService:
     """
     Voice Pipeline:
@@ -19,18 +50,37 @@ class VoiceService:
 
     def __init__(self):
         self._whisper_model = None
+        self._faster_whisper = False  # True when the CTranslate2 (faster-whisper) backend is loaded
 
     def _load_whisper(self):
-        """Lazy-load Whisper model (downloads on first use ~73MB for base)."""
+        """
+        Lazy-load Whisper model (downloads on first use ~73MB for base).
+        Prefers faster-whisper (CTranslate2, int8) and falls back to openai-whisper.
+        """
         if self._whisper_model is None:
-            import whisper
             from app.config import get_settings
 
             settings = get_settings()
             model_size = settings.whisper_model_size
             logger.info(f"📦 Loading Whisper model: {model_size}...")
-            self._whisper_model = whisper.load_model(model_size)
-            logger.info("✅ Whisper model loaded.")
+            try:
+                from faster_whisper import WhisperModel
+                import ctranslate2
+
+                cuda = ctranslate2.get_cuda_device_count() > 0
+                self._whisper_model = WhisperModel(
+                    model_size,
+                    device="cuda" if cuda else "cpu",
+                    compute_type="int8_float16" if cuda else "int8",
+                    cpu_threads=os.cpu_count() or 0,
+                )
+                self._faster_whisper = True
+                logger.info("✅ Whisper model loaded (faster-whisper, int8).")
+            except ImportError:
+                import whisper
+
+                self._whisper_model = whisper.load_model(model_size)
+                logger.info("✅ Whisper model loaded.")
         return self._whisper_model
 
     async def transcribe(self, audio_bytes: bytes) -> tuple[str, str]:
@@ -38,13 +88,26 @@ class VoiceService:
         Transcribe audio bytes to text using Whisper.
         Returns: (transcribed_text, detected_language)
         """
-        # Save to temp file (Whisper needs a file path)
+        model = self._load_whisper()
+        if self._faster_whisper:
+            try:
+                # faster-whisper decodes in memory (PyAV): no temp file, no ffmpeg subprocess.
+                # VAD filter drops silent stretches before decoding.
+                segments, info = model.transcribe(io.BytesIO(audio_bytes), beam_size=5, vad_filter=True)
+                text = " ".join(segment.text.strip() for segment in segments).strip()
+                language = info.language or "en"
+                logger.info(f"🎙️ STT: '{text[:50]}...' (lang={language})")
+                return text, language
+            except Exception as e:
+                logger.error(f"❌ Whisper transcription failed: {e}")
+                raise
+
+        # Save to temp file (openai-whisper needs a file path for ffmpeg)
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
             f.write(audio_bytes)
             temp_path = f.name
 
         try:
-            model = self._load_whisper()
             result = model.transcribe(temp_path)
             text = result.get("text", "").strip()
             language = result.get("language", "en")
@@ -62,6 +125,24 @@ class VoiceService:
         Convert text to speech using Edge-TTS (Microsoft's free TTS).
         Returns: path to generated MP3 audio file.
         """
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            output_path = f.name
+        try:
+            with open(output_path, "wb") as f:
+                async for chunk in self.synthesize_stream(text, language, slow):
+                    f.write(chunk)
+            logger.info(f"🔊 TTS: Generated audio ({language}) → {output_path}")
+            return output_path
+        except Exception as e:
+            logger.error(f"❌ Edge-TTS failed: {e}")
+            os.unlink(output_path)
+            raise
+
+    async def synthesize_stream(self, text: str, language: str = "en", slow: bool = False) -> AsyncIterator[bytes]:
+        """
+        Stream MP3 chunks from Edge-TTS as they arrive — suitable for a
+        StreamingResponse, no file on disk.
+        """
         voice = self._get_voice(language)
         rate = "-30%" if slow else "+0%"  # Slow mode for elders
 
@@ -69,44 +150,14 @@ class VoiceService:
         if len(text) > 3000:
             text = text[:3000] + "..."
 
-        try:
-            output_path = tempfile.mktemp(suffix=".mp3")
-            communicate = edge_tts.Communicate(text, voice, rate=rate)
-            await communicate.save(output_path)
-            logger.info(f"🔊 TTS: Generated audio ({language}) → {output_path}")
-            return output_path
-        except Exception as e:
-            logger.error(f"❌ Edge-TTS failed: {e}")
-            raise
+        communicate = edge_tts.Communicate(text, voice, rate=rate)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
 
     def _get_voice(self, language: str) -> str:
         """Map language codes to Edge-TTS voice names (Indian variants)."""
-        voice_map = {
-            # --- Major Indian Languages ---
-            "en": "en-IN-NeerjaNeural",        # Indian English (Female)
-            "hi": "hi-IN-SwaraNeural",          # Hindi (Female)
-            "ta": "ta-IN-PallaviNeural",        # Tamil (Female)
-            "te": "te-IN-ShrutiNeural",         # Telugu (Female)
-            "kn": "kn-IN-SapnaNeural",          # Kannada (Female)
-            "ml": "ml-IN-SobhanaNeural",        # Malayalam (Female)
-            "bn": "bn-IN-TanishaaNeural",       # Bengali (Female)
-            "mr": "mr-IN-AarohiNeural",         # Marathi (Female)
-            "gu": "gu-IN-DhwaniNeural",         # Gujarati (Female)
-            "pa": "pa-IN-GurpreetNeural",       # Punjabi (Male — only option)
-            "ur": "ur-IN-GulNeural",            # Urdu (Female)
-            # --- Male alternatives ---
-            "en-m": "en-IN-PrabhatNeural",      # Indian English (Male)
-            "hi-m": "hi-IN-MadhurNeural",       # Hindi (Male)
-            "ta-m": "ta-IN-ValluvarNeural",     # Tamil (Male)
-            "te-m": "te-IN-MohanNeural",        # Telugu (Male)
-            "kn-m": "kn-IN-GaganNeural",        # Kannada (Male)
-            "ml-m": "ml-IN-MidhunNeural",       # Malayalam (Male)
-            "bn-m": "bn-IN-BashkarNeural",      # Bengali (Male)
-            "mr-m": "mr-IN-ManoharNeural",      # Marathi (Male)
-            "gu-m": "gu-IN-NiranjanNeural",     # Gujarati (Male)
-            "ur-m": "ur-IN-SalmanNeural",       # Urdu (Male)
-        }
-        return voice_map.get(language, "en-IN-NeerjaNeural")
+        return _VOICE_MAP.get(language, "en-IN-NeerjaNeural")
 
 
 # --- Singleton ---
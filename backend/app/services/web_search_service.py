@@ -4,12 +4,22 @@ Uses manual scraping of DuckDuckGo HTML version to fetch real-time information.
 This implementation is robust against library deprecations and API failures.
 """
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from app.utils.logger import logger
 import asyncio
-import functools
 import re
+import time
+from collections import OrderedDict
+from urllib.parse import unquote
+
+try:
+    # selectolax: C (Lexbor) HTML parser, much faster than bs4 + html.parser
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+_UDDG_RE = re.compile(r'uddg=([^&]+)')
 
 class WebSearchService:
     """
@@ -17,26 +27,45 @@ class WebSearchService:
     Scrapes https://html.duckduckgo.com/html/ to bypass API limits.
     """
 
+    DDG_URL = "https://html.duckduckgo.com/html/"
+    CACHE_SIZE = 1024
+    CACHE_TTL = 10 * 60  # 10 minutes: fresh enough for news, spares DDG on hot queries
+
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        })
+        # Shared keep-alive HTTP/2 client: repeat searches skip the TCP + TLS handshake
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+            },
+        )
+        # Cache: {(query, limit): (formatted_results, expires_at)}, LRU-evicted
+        self._cache: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+
+    async def aclose(self):
+        """Close the shared HTTP client. Call on shutdown."""
+        await self._client.aclose()
 
     async def search(self, query: str, limit: int = 5) -> str:
         """
         Performs a web search and returns a markdown-formatted summary of results.
         Returns empty string if search fails.
         """
+        key = (query, limit)
+        if key in self._cache:
+            formatted, expires = self._cache[key]
+            if time.monotonic() < expires:
+                self._cache.move_to_end(key)
+                logger.debug(f"🔍 Web search cache hit for: '{query}'")
+                return formatted
+            del self._cache[key]
+
         try:
             logger.info(f"🔍 Searching Web (DDG HTML) for: '{query}'")
 
-            # Run sync scraping in a thread
-            loop = asyncio.get_running_loop()
-            results = await loop.run_in_executor(
-                None, 
-                functools.partial(self._scrape_ddg_html, query, limit)
-            )
+            results = await self._scrape_ddg_html(query, limit)
 
             if not results:
                 logger.warning(f"⚠️ No web results found for: '{query}'")
@@ -54,84 +83,120 @@ class WebSearchService:
                     f"{i}. **[{title}]({link})**\n   {snippet}"
                 )
             
-            return "\n\n".join(formatted_parts)
+            formatted = "\n\n".join(formatted_parts)
+            self._cache[key] = (formatted, time.monotonic() + self.CACHE_TTL)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return formatted
 
         except Exception as e:
             logger.error(f"❌ Web search failed: {e}")
             return ""
 
-    def _scrape_ddg_html(self, query: str, limit: int):
+    async def _scrape_ddg_html(self, query: str, limit: int):
         """
         Scrapes HTML from DuckDuckGo lite version.
         This version is lighter and less likely to block simple requests.
         """
         try:
-            url = "https://html.duckduckgo.com/html/"
-            data = {"q": query}
-            
-            # Use a timeout to prevent hanging
-            res = self.session.post(url, data=data, timeout=5)
+            res = await self._client.post(self.DDG_URL, data={"q": query})
             
             if res.status_code != 200:
                 logger.warning(f"DDG returned status code: {res.status_code}")
                 return []
 
-            soup = BeautifulSoup(res.text, "html.parser")
-            results = []
-            
-            # Iterate over result links
-            # Structure: 
-            # <div class="result ...">
-            #   <h2 class="result__title"><a class="result__a" href="...">Title</a></h2>
-            #   <a class="result__snippet" href="...">Snippet...</a>
-            # </div>
-            
-            # We look for result__a
-            links = soup.find_all("a", class_="result__a")
-            
-            for link in links:
-                if len(results) >= limit:
-                    break
-                    
-                title = link.text.strip()
-                href = link.get("href")
-                snippet = ""
-                
-                # Try to find snippet in the same result container
-                # Traverse up to find the result div
-                result_div = link.find_parent("div", class_="result__body") or link.find_parent("div", class_="result")
-                
-                if result_div:
-                    snippet_tag = result_div.find("a", class_="result__snippet")
-                    if snippet_tag:
-                        snippet = snippet_tag.text.strip()
-
-                if href and title:
-                    # Clean up DDG redirect URLs if possible, but raw URLs work okay
-                    # DDG HTML URLs are often /l/?kh=-1&uddg=...
-                    # We can try to extract the real URL but for RAG context it might not matter
-                    # as long as the content is in the title/snippet.
-                    
-                    # Decent cleanup attempt:
-                    if "/l/?" in href:
-                        # try to extract 'uddg' param
-                        match = re.search(r'uddg=([^&]+)', href)
-                        if match:
-                             from urllib.parse import unquote
-                             href = unquote(match.group(1))
-
-                    results.append({
-                        "title": title,
-                        "href": href,
-                        "snippet": snippet
-                    })
-            
-            return results
+            # Only the CPU-bound parse goes to a worker thread
+            return await asyncio.to_thread(self._parse_results, res.text, limit)
 
         except Exception as e:
             logger.error(f"DDG Scraping Error: {e}")
             return []
 
+    def _parse_results(self, html: str, limit: int) -> list[dict]:
+        """Extract title / link / snippet dicts from a DDG HTML results page."""
+        if HTMLParser is None:
+            return self._parse_results_bs4(html, limit)
+
+        # Structure:
+        # <div class="result ...">
+        #   <h2 class="result__title"><a class="result__a" href="...">Title</a></h2>
+        #   <a class="result__snippet" href="...">Snippet...</a>
+        # </div>
+        results = []
+        for link in HTMLParser(html).css("a.result__a"):
+            if len(results) >= limit:
+                break
+
+            title = link.text().strip()
+            href = link.attributes.get("href")
+            snippet = ""
+
+            # Snippet lives in the same result container
+            result_div = _find_parent_div(link, "result__body") or _find_parent_div(link, "result")
+            if result_div:
+                snippet_tag = result_div.css_first("a.result__snippet")
+                if snippet_tag:
+                    snippet = snippet_tag.text().strip()
+
+            if href and title:
+                results.append({
+                    "title": title,
+                    "href": _clean_href(href),
+                    "snippet": snippet
+                })
+
+        return results
+
+    def _parse_results_bs4(self, html: str, limit: int) -> list[dict]:
+        """BeautifulSoup fallback for _parse_results when selectolax is not installed."""
+        soup = BeautifulSoup(html, "html.parser")
+        results = []
+
+        for link in soup.find_all("a", class_="result__a"):
+            if len(results) >= limit:
+                break
+
+            title = link.text.strip()
+            href = link.get("href")
+            snippet = ""
+
+            result_div = link.find_parent("div", class_="result__body") or link.find_parent("div", class_="result")
+            if result_div:
+                snippet_tag = result_div.find("a", class_="result__snippet")
+                if snippet_tag:
+                    snippet = snippet_tag.text.strip()
+
+            if href and title:
+                results.append({
+                    "title": title,
+                    "href": _clean_href(href),
+                    "snippet": snippet
+                })
+
+        return results
+
+
+def _find_parent_div(node, css_class: str):
+    """Nearest <div> ancestor carrying css_class (selectolax nodes)."""
+    node = node.parent
+    while node is not None:
+        if node.tag == "div" and css_class in (node.attributes.get("class") or "").split():
+            return node
+        node = node.parent
+    return None
+
+
+def _clean_href(href: str) -> str:
+    """
+    DDG HTML links are often redirects (/l/?kh=-1&uddg=...); unwrap the real URL.
+    Raw URLs work okay for RAG context, but the target is nicer to cite.
+    """
+    if "/l/?" in href:
+        match = _UDDG_RE.search(href)
+        if match:
+            return unquote(match.group(1))
+    return href
+
 
 # --- Singleton ---
 _web_search_service: WebSearchService | None = None
@@ -143,3 +208,11 @@ def get_web_search_service() -> WebSearchService:
     if _web_search_service is None:
         _web_search_service = WebSearchService()
     return _web_search_service
+
+
+async def close_web_search_service():
+    """Close the singleton's HTTP client, if it was ever created. Call on shutdown."""
+    global _web_search_service
+    if _web_search_service is not None:
+        await _web_search_service.aclose()
+        _web_search_service = None
@@ -5,41 +5,58 @@ Uses in-memory store (no Redis needed — zero cost).
 """
 
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 
 
 class RateLimiter(BaseHTTPMiddleware):
     """
-    Simple in-memory rate limiter.
-    Default: 60 requests per minute per IP.
+    Simple in-memory rate limiter (token bucket).
+    Default: 60 requests per minute per IP, with bursts up to the full minute's quota.
     """
 
+    MAX_TRACKED_IPS = 100_000
+
     def __init__(self, app, requests_per_minute: int = 60):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.window = 60  # seconds
-        self._store: dict[str, list[float]] = defaultdict(list)
+        self._refill_rate = requests_per_minute / self.window  # tokens per second
+        # ip → (tokens, last_seen), ordered oldest-seen first
+        self._store: OrderedDict[str, tuple[float, float]] = OrderedDict()
 
     async def dispatch(self, request: Request, call_next):
         client_ip = request.client.host if request.client else "unknown"
-        now = time.time()
+        now = time.monotonic()
 
-        # Clean old entries
-        self._store[client_ip] = [
-            t for t in self._store[client_ip] if now - t < self.window
-        ]
+        # Refill for the time elapsed since this IP's last request
+        tokens, last = self._store.pop(client_ip, (self.requests_per_minute, now))
+        self._evict_idle(now)
+        tokens = min(self.requests_per_minute, tokens + (now - last) * self._refill_rate)
 
         # Check rate
-        if len(self._store[client_ip]) >= self.requests_per_minute:
+        if tokens < 1:
+            self._store[client_ip] = (tokens, now)
             raise HTTPException(
                 status_code=429,
                 detail="Too many requests. Please wait a minute and try again.",
             )
 
         # Record request
-        self._store[client_ip].append(now)
+        self._store[client_ip] = (tokens - 1, now)
 
         response = await call_next(request)
         return response
+
+    def _evict_idle(self, now: float):
+        """
+        Forget IPs idle for a full window — their bucket has refilled, so they
+        are indistinguishable from new clients. Bounded by MAX_TRACKED_IPS.
+        """
+        store = self._store
+        while store:
+            oldest_ip, (_, last) = next(iter(store.items()))
+            if now - last < self.window and len(store) < self.MAX_TRACKED_IPS:
+                break
+            del store[oldest_ip]
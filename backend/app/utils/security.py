@@ -16,6 +16,7 @@ from cryptography.fernet import Fernet
 # ══════════════════════════════════════════
 
 _encryption_key: bytes | None = None
+_fernet: Fernet | None = None
 
 
 def _get_key() -> bytes:
@@ -28,26 +29,41 @@ def _get_key() -> bytes:
     return _encryption_key
 
 
+def _cipher() -> Fernet:
+    """Shared Fernet instance (key decoding + sub-key split done once)."""
+    global _fernet
+    if _fernet is None:
+        _fernet = Fernet(_get_key())
+    return _fernet
+
+
 def encrypt_pii(plaintext: str) -> str:
     """Encrypt sensitive PII data (Aadhaar, phone, etc.)."""
     if not plaintext:
         return ""
-    f = Fernet(_get_key())
-    return f.encrypt(plaintext.encode()).decode()
+    return _cipher().encrypt(plaintext.encode()).decode()
 
 
 def decrypt_pii(ciphertext: str) -> str:
     """Decrypt PII data for temporary use."""
     if not ciphertext:
         return ""
-    f = Fernet(_get_key())
-    return f.decrypt(ciphertext.encode()).decode()
+    return _cipher().decrypt(ciphertext.encode()).decode()
 
 
 # ══════════════════════════════════════════
 # Input Sanitization
 # ══════════════════════════════════════════
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_CTRL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+MAX_INPUT_CHARS = 2000  # max chat message length after sanitization
+# Raw characters scanned by sanitize_input: bounds regex work on huge payloads
+# while leaving room for markup that is stripped before the length cut
+_MAX_SCAN_CHARS = 10 * MAX_INPUT_CHARS
+
+
 def sanitize_input(text: str) -> str:
     """
     Clean user input to prevent injection attacks.
@@ -55,20 +71,29 @@ def sanitize_input(text: str) -> str:
     """
     if not text:
         return ""
+    # Bound regex work on oversized payloads
+    text = text[:_MAX_SCAN_CHARS]
     # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _TAG_RE.sub("", text)
     # Remove control characters
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text)
+    text = _CTRL_RE.sub("", text)
     # Trim and limit length (max 2000 chars for chat)
-    text = text.strip()[:2000]
+    text = text.strip()[:MAX_INPUT_CHARS]
     return text
 
 
+def _digits(text: str) -> str:
+    """Keep only decimal digits (same set as regex \\d), skipping the copy when already clean."""
+    if text.isdecimal():
+        return text
+    return "".join(filter(str.isdecimal, text))
+
+
 def sanitize_phone(phone: str) -> str:
     """Normalize phone number to digits only."""
     if not phone:
         return ""
-    digits = re.sub(r"\D", "", phone)
+    digits = _digits(phone)
     # Indian phone: 10 digits or 12 digits with country code
     if len(digits) == 12 and digits.startswith("91"):
         digits = digits[2:]
@@ -77,7 +102,7 @@ def sanitize_phone(phone: str) -> str:
 
 def mask_aadhaar(aadhaar: str) -> str:
     """Mask Aadhaar number for display: XXXX-XXXX-1234."""
-    digits = re.sub(r"\D", "", aadhaar)
+    digits = _digits(aadhaar)
     if len(digits) == 12:
         return f"XXXX-XXXX-{digits[-4:]}"
     return "XXXX-XXXX-XXXX"
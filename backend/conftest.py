@@ -0,0 +1,24 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests that call real external services",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: calls real external services (needs --run-network)")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Manual smoke scripts hit NVIDIA / DuckDuckGo etc.; opt in explicitly
+    if config.getoption("--run-network"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip)
@@ -1,15 +1,44 @@
 """Discover the correct MyScheme.gov.in API endpoints."""
-import requests
+import asyncio
+import httpx
+import orjson
 import re
-import json
+from pathlib import Path
+
+try:
+    # hishel: on-disk HTTP cache for httpx — re-runs while iterating on the
+    # parsing below skip the network entirely
+    from hishel import AsyncCacheClient, AsyncFileStorage, Controller
+except ImportError:
+    AsyncCacheClient = None
 
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Accept": "*/*",
 }
 
+SEARCH_URL = "https://www.myscheme.gov.in/search"
+SCHEME_URL = "https://www.myscheme.gov.in/schemes/pradhan-mantri-jan-dhan-yojana"
+
+# Patterns compiled once at import; bytes patterns scan response bodies
+# without decoding them — only the captured pieces are decoded for printing
+SCRIPT_RE = re.compile(rb'src=["\']([^"\']+(?:\.js|chunk)[^"\']*)["\']')
+API_RE = re.compile(rb'["\'](/(?:api|_next/data|v1|v2)[^"\']*)["\']')
+NEXT_DATA_RE = re.compile(rb'__NEXT_DATA__\s*=\s*(\{.*?\})\s*;?\s*</script>', re.DOTALL)
+INLINE_SCRIPT_RE = re.compile(rb'<script[^>]*>(.*?)</script>', re.DOTALL)
+FETCH_RE = re.compile(rb'fetch\s*\(\s*["\']([^"\']+)["\']')
+AXIOS_RE = re.compile(rb'axios\.\w+\s*\(\s*["\']([^"\']+)["\']')
+BUILD_ID_RE = re.compile(rb'"buildId"\s*:\s*"([^"]+)"')
+
+CACHE_DIR = Path(__file__).parent / "data" / ".discover_cache"
+CACHE_TTL = 60 * 60  # 1 hour: the pages are static between deploys
+
+
+def _decoded(matches: list[bytes]) -> list[str]:
+    return [m.decode("utf-8", "replace") for m in matches]
+
+
 # Step 1: Try known API patterns
-print("=== Testing API endpoints ===")
 urls = [
     "https://www.myscheme.gov.in/api/v1/schemes?page=1&per_page=10",
     "https://www.myscheme.gov.in/api/schemes?page=1",
@@ -17,41 +46,58 @@ urls = [
     "https://www.myscheme.gov.in/api/v1/search?keyword=&page=1",
 ]
 
-for url in urls:
-    try:
-        r = requests.get(url, headers=headers, timeout=10, verify=False, allow_redirects=True)
-        ct = r.headers.get("content-type", "")
-        print(f"{r.status_code} | {ct[:30]:30s} | {url}")
-        if r.status_code == 200 and "json" in ct:
-            data = r.json()
-            print(f"  Keys: {list(data.keys())[:10]}")
-            print(f"  Preview: {str(data)[:300]}")
-    except Exception as e:
-        print(f"ERR  | {url}: {type(e).__name__}")
 
-# Step 2: Fetch the search page and find API endpoints in the HTML/JS
-print("\n=== Analyzing search page HTML ===")
-try:
-    r = requests.get("https://www.myscheme.gov.in/search", headers=headers, timeout=15, verify=False)
-    text = r.text
+async def probe(client: httpx.AsyncClient, url: str):
+    """GET one candidate endpoint → (status, content-type, response)."""
+    r = await client.get(url)
+    return r.status_code, r.headers.get("content-type", ""), r
+
+
+def report_endpoints(results):
+    print("=== Testing API endpoints ===")
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"ERR  | {url}: {type(result).__name__}")
+            continue
+        status, ct, r = result
+        print(f"{status} | {ct[:30]:30s} | {url}")
+        if status == 200 and "json" in ct:
+            try:
+                data = orjson.loads(r.content)
+                print(f"  Keys: {list(data.keys())[:10]}")
+                print(f"  Preview: {str(data)[:300]}")
+            except Exception as e:
+                print(f"ERR  | {url}: {type(e).__name__}")
+
+
+def parse_search_page(body: bytes):
+    """Scan the /search body once for the pieces steps 2 and 3 both need.
+
+    Returns (__NEXT_DATA__ match, buildId match); either may be None.
+    """
+    return NEXT_DATA_RE.search(body), BUILD_ID_RE.search(body)
+
+
+# Step 2: Analyze the search page HTML/JS for API endpoints
+def analyze_search_page(body: bytes, next_data):
+    print("\n=== Analyzing search page HTML ===")
     
     # Find all script src URLs
-    scripts = re.findall(r'src=["\']([^"\']+(?:\.js|chunk)[^"\']*)["\']', text)
+    scripts = _decoded(SCRIPT_RE.findall(body))
     print(f"Scripts found: {len(scripts)}")
     for s in scripts[:10]:
         print(f"  {s}")
     
     # Find any _next/data or API patterns
-    api_patterns = re.findall(r'["\'](/(?:api|_next/data|v1|v2)[^"\']*)["\']', text)
+    api_patterns = _decoded(API_RE.findall(body))
     print(f"\nAPI patterns in HTML: {len(api_patterns)}")
     for p in set(api_patterns[:20]):
         print(f"  {p}")
     
     # Look for __NEXT_DATA__ (Next.js apps embed initial data)
-    next_data = re.search(r'__NEXT_DATA__\s*=\s*(\{.*?\})\s*;?\s*</script>', text, re.DOTALL)
     if next_data:
         try:
-            nd = json.loads(next_data.group(1))
+            nd = orjson.loads(next_data.group(1))
             print(f"\n__NEXT_DATA__ found! Top keys: {list(nd.keys())}")
             if "props" in nd:
                 print(f"  props keys: {list(nd['props'].keys())[:5]}")
@@ -68,59 +114,56 @@ try:
                                 print(f"    First item preview: {str(val[0])[:300]}")
                         elif isinstance(val, dict):
                             print(f"  pageProps.{key}: dict with keys {list(val.keys())[:10]}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"  Failed to parse __NEXT_DATA__: {e}")
     else:
         print("\nNo __NEXT_DATA__ found (not a Next.js app or SSR)")
     
     # Look for fetch/axios API calls in inline scripts
-    inline_scripts = re.findall(r'<script[^>]*>(.*?)</script>', text, re.DOTALL)
-    for script in inline_scripts:
-        if len(script) > 50:
-            fetches = re.findall(r'fetch\s*\(\s*["\']([^"\']+)["\']', script)
+    # Matches are consumed lazily and scanned in place (pos/endpos), so no
+    # script body is ever copied out of the page
+    for m in INLINE_SCRIPT_RE.finditer(body):
+        start, end = m.span(1)
+        if end - start > 50:
+            fetches = _decoded(FETCH_RE.findall(body, start, end))
             if fetches:
                 print(f"\nfetch() calls found: {fetches[:5]}")
-            axios_calls = re.findall(r'axios\.\w+\s*\(\s*["\']([^"\']+)["\']', script)
+            axios_calls = _decoded(AXIOS_RE.findall(body, start, end))
             if axios_calls:
                 print(f"axios calls found: {axios_calls[:5]}")
 
-except Exception as e:
-    print(f"Failed: {e}")
 
-# Step 3: Try Next.js data route  
-print("\n=== Testing Next.js _next/data routes ===")
-try:
-    # First get the build ID
-    r = requests.get("https://www.myscheme.gov.in/search", headers=headers, timeout=15, verify=False)
-    build_id_match = re.search(r'"buildId"\s*:\s*"([^"]+)"', r.text)
-    if build_id_match:
-        build_id = build_id_match.group(1)
-        print(f"Build ID: {build_id}")
-        
-        # Try Next.js data route
-        next_url = f"https://www.myscheme.gov.in/_next/data/{build_id}/search.json"
-        r2 = requests.get(next_url, headers=headers, timeout=15, verify=False)
-        print(f"Next.js data route: {r2.status_code}")
-        if r2.status_code == 200:
-            data = r2.json()
-            print(f"Keys: {list(data.keys())}")
-            if "pageProps" in data:
-                print(f"pageProps keys: {list(data['pageProps'].keys())[:10]}")
-    else:
-        print("No build ID found")
-except Exception as e:
-    print(f"Next.js data route failed: {e}")
+# Step 3: Try Next.js data route (build ID comes from the same search page)
+async def probe_next_data(client: httpx.AsyncClient, build_id_match):
+    print("\n=== Testing Next.js _next/data routes ===")
+    try:
+        if build_id_match:
+            build_id = build_id_match.group(1).decode()
+            print(f"Build ID: {build_id}")
+
+            # Try Next.js data route
+            next_url = f"https://www.myscheme.gov.in/_next/data/{build_id}/search.json"
+            r2 = await client.get(next_url, timeout=15)
+            print(f"Next.js data route: {r2.status_code}")
+            if r2.status_code == 200:
+                data = orjson.loads(r2.content)
+                print(f"Keys: {list(data.keys())}")
+                if "pageProps" in data:
+                    print(f"pageProps keys: {list(data['pageProps'].keys())[:10]}")
+        else:
+            print("No build ID found")
+    except Exception as e:
+        print(f"Next.js data route failed: {e}")
+
 
 # Step 4: Try individual scheme page
-print("\n=== Testing individual scheme page ===")
-try:
-    r = requests.get("https://www.myscheme.gov.in/schemes/pradhan-mantri-jan-dhan-yojana", 
-                     headers=headers, timeout=15, verify=False)
+def analyze_scheme_page(r: httpx.Response):
+    print("\n=== Testing individual scheme page ===")
     print(f"Status: {r.status_code}")
     
-    next_data = re.search(r'__NEXT_DATA__\s*=\s*(\{.*?\})\s*;?\s*</script>', r.text, re.DOTALL)
+    next_data = NEXT_DATA_RE.search(r.content)
     if next_data:
-        nd = json.loads(next_data.group(1))
+        nd = orjson.loads(next_data.group(1))
         if "props" in nd and "pageProps" in nd["props"]:
             pp = nd["props"]["pageProps"]
             print(f"pageProps keys: {list(pp.keys())[:15]}")
@@ -132,5 +175,56 @@ try:
                     print(f"  {key} (dict): {list(val.keys())[:10]}")
                 elif isinstance(val, list):
                     print(f"  {key} (list): {len(val)} items")
-except Exception as e:
-    print(f"Failed: {e}")
+
+
+def make_client() -> httpx.AsyncClient:
+    """Pooled HTTP/2 client, cached on disk for CACHE_TTL when hishel is installed."""
+    kwargs = dict(headers=headers, verify=False, timeout=10, http2=True, follow_redirects=True)
+    if AsyncCacheClient is None:
+        return httpx.AsyncClient(**kwargs)
+    # force_cache: these pages send no-cache headers, but for reconnaissance
+    # runs a 1-hour-old copy is exactly what we want
+    return AsyncCacheClient(
+        storage=AsyncFileStorage(base_path=CACHE_DIR, ttl=CACHE_TTL),
+        controller=Controller(force_cache=True),
+        **kwargs,
+    )
+
+
+async def main():
+    # One pooled keep-alive client; every independent fetch runs concurrently
+    async with make_client() as client:
+        probes, search, scheme = await asyncio.gather(
+            asyncio.gather(*(probe(client, url) for url in urls), return_exceptions=True),
+            client.get(SEARCH_URL, timeout=15),
+            client.get(SCHEME_URL, timeout=15),
+            return_exceptions=True,
+        )
+
+        report_endpoints(probes)
+
+        if isinstance(search, Exception):
+            print("\n=== Analyzing search page HTML ===")
+            print(f"Failed: {search}")
+            print("\n=== Testing Next.js _next/data routes ===")
+            print(f"Next.js data route failed: {search}")
+        else:
+            # A single /search fetch feeds both the HTML analysis and the build-ID lookup
+            next_data, build_id_match = parse_search_page(search.content)
+            try:
+                analyze_search_page(search.content, next_data)
+            except Exception as e:
+                print(f"Failed: {e}")
+            await probe_next_data(client, build_id_match)
+
+        if isinstance(scheme, Exception):
+            print("\n=== Testing individual scheme page ===")
+            print(f"Failed: {scheme}")
+        else:
+            try:
+                analyze_scheme_page(scheme)
+            except Exception as e:
+                print(f"Failed: {e}")
+
+
+asyncio.run(main())
@@ -1,6 +1,16 @@
 import asyncio
+
+import pytest
+
+from app.config import get_settings
 from app.core.nvidia_client import get_nvidia_client
 
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.asyncio,
+    pytest.mark.skipif(not get_settings().nvidia_api_key, reason="NVIDIA_API_KEY not set"),
+]
+
 async def test():
     nvidia = get_nvidia_client()
     result = await nvidia.generate(
@@ -10,4 +20,5 @@ async def test():
     )
     print("OK:", result[:500])
 
-asyncio.run(test())
+if __name__ == "__main__":
+    asyncio.run(test())
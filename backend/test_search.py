@@ -4,20 +4,29 @@ import os
 sys.path.append(os.getcwd())
 
 import asyncio
+
+import pytest
+
 from app.services.web_search_service import get_web_search_service
 
-# Force UTF-8 encoding for stdout/stderr to handle emojis if possible
-sys.stdout.reconfigure(encoding='utf-8')
-sys.stderr.reconfigure(encoding='utf-8')
+pytestmark = [pytest.mark.network, pytest.mark.asyncio]
 
 async def test():
     try:
         service = get_web_search_service()
         
-        # Test 1: Simple query
         query1 = "Tamil Nadu Chief Minister"
+        query2 = "Ulagam Ungal Kaiyil scheme 2026"
         print(f"Test 1: Searching for: {query1}")
-        results1 = await service.search(query1)
+        print(f"Test 2: Searching for: {query2}")
+
+        # Both queries share the service's HTTP/2 client and run concurrently
+        async with asyncio.TaskGroup() as tg:
+            task1 = tg.create_task(service.search(query1))
+            task2 = tg.create_task(service.search(query2))
+
+        # Test 1: Simple query
+        results1 = task1.result()
         if results1:
             print("Results found (length:", len(results1), ")")
         else:
@@ -26,9 +35,7 @@ async def test():
         print("-" * 20)
 
         # Test 2: User query
-        query2 = "Ulagam Ungal Kaiyil scheme 2026"
-        print(f"Test 2: Searching for: {query2}")
-        results2 = await service.search(query2)
+        results2 = task2.result()
         if results2:
             print("Results found (length:", len(results2), ")")
             print(results2[:500] + "...") # Print first 500 chars
@@ -39,4 +46,7 @@ async def test():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    # Force UTF-8 encoding for stdout/stderr to handle emojis if possible
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
     asyncio.run(test())
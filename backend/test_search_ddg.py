@@ -1,16 +1,19 @@
 
 import asyncio
-from duckduckgo_search import DDGS
+
+import pytest
+
+from test_search_manual import ddg_search, make_client, print_results
+
+pytestmark = [pytest.mark.network, pytest.mark.asyncio]
 
 async def test():
-    print("Testing DDGS with backend='html'...")
+    print("Testing DDG HTML search (httpx + selectolax)...")
     try:
-        ddgs = DDGS()
-        # backend='html', 'lite', 'auto'
-        results = list(ddgs.text("Tamil Nadu Chief Minister", max_results=3, backend="html"))
+        async with make_client() as client:
+            results = await ddg_search(client, "Tamil Nadu Chief Minister", max_results=3)
         print(f"Results found: {len(results)}")
-        for r in results:
-            print(r)
+        print_results(results)
     except Exception as e:
         print(f"Error: {e}")
 
@@ -1,45 +1,55 @@
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
 
-def manual_search(query):
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+DDG_URL = "https://html.duckduckgo.com/html/"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+
+def make_client():
+    # Shared keep-alive client: concurrent queries reuse the TLS connection to DDG
+    return httpx.AsyncClient(headers=HEADERS, timeout=10)
+
+
+async def ddg_search(client, query, max_results=5):
     print(f"Manual scraping for: {query}")
     try:
-        url = "https://html.duckduckgo.com/html/"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        data = {"q": query}
-        
         # DDG HTML version uses POST
-        res = requests.post(url, data=data, headers=headers, timeout=10)
+        res = await client.post(DDG_URL, data={"q": query})
         
         if res.status_code != 200:
             print(f"Failed with status: {res.status_code}")
             return []
 
-        soup = BeautifulSoup(res.text, "html.parser")
+        tree = LexborHTMLParser(res.text)
         results = []
         
         # Select result links
-        for i, link in enumerate(soup.find_all("a", class_="result__a"), 1):
-            title = link.text.strip()
-            href = link.get("href")
+        for link in tree.css("a.result__a"):
+            title = link.text().strip()
+            href = link.attributes.get("href")
             # snippet is usually in a sibling div
             snippet = ""
             
             # Try to find snippet
-            parent = link.find_parent("div", class_="result__body")
+            parent = link.parent
+            while parent is not None and not (
+                parent.tag == "div" and "result__body" in (parent.attributes.get("class") or "").split()
+            ):
+                parent = parent.parent
             if parent:
-                snippet_div = parent.find("a", class_="result__snippet")
+                snippet_div = parent.css_first("a.result__snippet")
                 if snippet_div:
-                    snippet = snippet_div.text.strip()
+                    snippet = snippet_div.text().strip()
             
             if href and title:
-                print(f"{i}. {title} ({href})")
-                results.append({"title": title, "href": href, "body": snippet})
+                results.append((title, href, snippet))
                 
-            if i >= 5: break
+            if len(results) >= max_results: break
             
         return results
         
@@ -47,7 +57,22 @@ def manual_search(query):
         print(f"Manual Error: {e}")
         return []
 
+
+def print_results(results):
+    for i, (title, href, _snippet) in enumerate(results, 1):
+        print(f"{i}. {title} ({href})")
+
+
+async def main():
+    async with make_client() as client:
+        # Both queries share one round-trip window instead of running back to back
+        batches = await asyncio.gather(
+            ddg_search(client, "Tamil Nadu Chief Minister"),
+            ddg_search(client, "Ulagam Ungal Kaiyil scheme 2026"),
+        )
+    for results in batches:
+        print("-" * 20)
+        print_results(results)
+
 if __name__ == "__main__":
-    manual_search("Tamil Nadu Chief Minister")
-    print("-" * 20)
-    manual_search("Ulagam Ungal Kaiyil scheme 2026")
+    asyncio.run(main())
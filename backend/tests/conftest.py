@@ -0,0 +1,11 @@
+import pytest
+
+from app.services.research_cache import ResearchCache
+
+
+@pytest.fixture(scope="session")
+def research_cache(tmp_path_factory):
+    """One SQLite-backed ResearchCache (temp file) shared by the whole session."""
+    path = tmp_path_factory.mktemp("research_cache") / "research_cache.sqlite3"
+    # Configured through the constructor: no env vars or settings cache to reset
+    return ResearchCache(path=str(path), ttl_minutes=10, enabled=True)
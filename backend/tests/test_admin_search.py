@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import admin
+
+
+class _StubQuery:
+    """Records the search filter used; fts() hits come from the stub client."""
+
+    def __init__(self, client):
+        self._client = client
+        self._fts = None
+
+    def select(self, *_, **__):
+        return self
+
+    def filter(self, column, operator, value):
+        self._fts = value
+        return self
+
+    def ilike(self, column, pattern):
+        self._client.calls.append(("ilike", pattern))
+        return self
+
+    def order(self, *_, **__):
+        return self
+
+    def range(self, *_):
+        return self
+
+    def execute(self):
+        if self._fts is None:
+            return SimpleNamespace(data=[{"name": "PM-Kisan"}], count=1)
+        self._client.calls.append(("fts", self._fts))
+        if self._client.fts_error:
+            raise self._client.fts_error
+        rows = self._client.fts_rows
+        return SimpleNamespace(data=rows, count=len(rows))
+
+
+class _StubClient:
+    def __init__(self, fts_rows=(), fts_error=None):
+        self.fts_rows = list(fts_rows)
+        self.fts_error = fts_error
+        self.calls = []
+
+    def table(self, *_):
+        return _StubQuery(self)
+
+
+@pytest.fixture(autouse=True)
+def _reset_fts(monkeypatch):
+    monkeypatch.setattr(admin, "_fts_available", True)
+
+
+def test_full_text_search_uses_prefix_terms():
+    client = _StubClient(fts_rows=[{"name": "PM-Kisan"}])
+    rows, total = admin._fetch_admin_schemes(client, 1, 20, "pm kis")
+    assert client.calls == [("fts", "pm:* & kis:*")]
+    assert total == 1
+
+
+def test_no_full_text_hits_falls_back_to_ilike():
+    client = _StubClient()
+    rows, total = admin._fetch_admin_schemes(client, 1, 20, "isan")
+    assert client.calls == [("fts", "isan:*"), ("ilike", "%isan%")]
+    assert rows == [{"name": "PM-Kisan"}]
+
+
+def test_missing_tsv_column_is_remembered():
+    client = _StubClient(fts_error=RuntimeError("column schemes.search_tsv does not exist"))
+    admin._fetch_admin_schemes(client, 1, 20, "kisan")
+    admin._fetch_admin_schemes(client, 1, 20, "kisan")
+    assert client.calls == [("fts", "kisan:*"), ("ilike", "%kisan%"), ("ilike", "%kisan%")]
+
+
+def test_transient_error_falls_back_for_one_request_only():
+    client = _StubClient(fts_error=TimeoutError("read timed out"))
+    admin._fetch_admin_schemes(client, 1, 20, "kisan")
+    client.fts_error = None
+    admin._fetch_admin_schemes(client, 1, 20, "kisan")
+    assert client.calls == [("fts", "kisan:*"), ("ilike", "%kisan%"), ("fts", "kisan:*"), ("ilike", "%kisan%")]
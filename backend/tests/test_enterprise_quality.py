@@ -1,28 +1,29 @@
 from datetime import datetime, timedelta, timezone
 
-from app.config import get_settings
+from app.config import Settings
 from app.services.providers.base import SearchResult
 from app.services.quality_scorer import get_quality_scorer
-from app.services.research_cache import ResearchCache
+
+
+# Frozen once per module: every fixture date is relative to the same instant
+NOW = datetime.now(timezone.utc)
 
 
 def _iso(days_ago: int) -> str:
-    dt = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    dt = NOW - timedelta(days=days_ago)
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def test_openai_key_aggregation_and_dedup(monkeypatch):
-    monkeypatch.setenv("OPENAI_API_KEY", "k1")
-    monkeypatch.setenv("OPENAI_API_KEY_2", "k2")
-    monkeypatch.setenv("OPENAI_API_KEY_3", "k1")
-    monkeypatch.setenv("OPENAI_API_KEYS_CSV", "k3,k2,k4")
-
-    get_settings.cache_clear()
-    settings = get_settings()
+def test_openai_key_aggregation_and_dedup():
+    # Init kwargs take precedence over env / .env, so this is hermetic
+    settings = Settings(
+        openai_api_key="k1",
+        openai_api_key_2="k2",
+        openai_api_key_3="k1",
+        openai_api_keys_csv="k3,k2,k4",
+    )
     assert settings.all_openai_keys == ["k1", "k2", "k3", "k4"]
 
-    get_settings.cache_clear()
-
 
 def test_verified_filter_news_is_recent_and_trusted():
     scorer = get_quality_scorer()
@@ -89,20 +90,13 @@ def test_verified_filter_accepts_gov_without_date():
     assert filtered[0].domain == "myscheme.gov.in"
 
 
-def test_research_cache_roundtrip(tmp_path, monkeypatch):
-    monkeypatch.setenv("RESEARCH_CACHE_ENABLED", "true")
-    monkeypatch.setenv("RESEARCH_CACHE_TTL_MINUTES", "10")
-    monkeypatch.setenv("RESEARCH_CACHE_PATH", str(tmp_path / "research_cache.sqlite3"))
-
-    get_settings.cache_clear()
-    cache = ResearchCache()
-
+def test_research_cache_roundtrip(research_cache):
     payload = {
         "answer": "Test answer",
         "sources": [{"url": "https://myscheme.gov.in"}],
         "language": "en",
     }
-    cache.put(
+    research_cache.put(
         query="PM Kisan update",
         language="en",
         intent="latest_news",
@@ -110,7 +104,7 @@ def test_research_cache_roundtrip(tmp_path, monkeypatch):
         payload=payload,
     )
 
-    loaded = cache.get(
+    loaded = research_cache.get(
         query="PM Kisan update",
         language="en",
         intent="latest_news",
@@ -118,5 +112,3 @@ def test_research_cache_roundtrip(tmp_path, monkeypatch):
     )
     assert loaded is not None
     assert loaded["answer"] == "Test answer"
-
-    get_settings.cache_clear()
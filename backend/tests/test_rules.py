@@ -2,8 +2,33 @@ import pytest
 import json
 from app.models.user import UserProfile
 from app.services.matching_service import MatchingService
+from types import SimpleNamespace
 # mock supabase for testing
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+
+class _StubQuery:
+    """Just the supabase query chain MatchingService uses: select → or_ → execute."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def select(self, *_):
+        return self
+
+    def or_(self, *_, **__):
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=self._data)
+
+
+class _StubClient:
+    def __init__(self, data):
+        self._data = data
+
+    def table(self, *_):
+        return _StubQuery(self._data)
 
 @pytest.fixture
 def mock_supabase():
@@ -28,8 +53,28 @@ def test_json_logic_evaluation():
     assert jsonLogic(rules, ineligible_age) is False
     assert jsonLogic(rules, ineligible_income) is False
 
+def test_compile_rule():
+    """Compiled rules agree with JSON logic and are cached per rule."""
+    from app.services.matching_service import compile_rule
+
+    rules = {"and": [{">=": [{"var": "age"}, 18]}, {"<": [{"var": "income"}, 200000]}]}
+    check = compile_rule(rules)
+
+    assert check({"age": 20, "income": 100000}) is True
+    assert check({"age": 16, "income": 100000}) is False
+    assert check({"age": 20, "income": 300000}) is False
+    assert compile_rule(json.loads(json.dumps(rules))) is check
+
+    # Strict equality compares type and value, never object identity
+    state = "".join(["Del", "hi"])
+    assert compile_rule({"===": [{"var": "income"}, 250000]})({"income": 250000}) is True
+    assert compile_rule({"===": [{"var": "state"}, "Delhi"]})({"state": state}) is True
+    assert compile_rule({"===": [{"var": "income"}, 250000]})({"income": 250000.0}) is False
+    assert compile_rule({"!==": [{"var": "state"}, "Delhi"]})({"state": state}) is False
+    assert compile_rule({"!==": [{"var": "income"}, 250000]})({"income": "250000"}) is True
+
 @pytest.mark.asyncio
-async def test_matching_service_logic(matching_service, mock_supabase):
+async def test_matching_service_logic(matching_service):
     """Test the MatchingService filter logic."""
     
     # Mock Scheme Data
@@ -49,9 +94,7 @@ async def test_matching_service_logic(matching_service, mock_supabase):
     ]
     
     # Setup mock return
-    mock_response = MagicMock()
-    mock_response.data = mock_schemes
-    mock_supabase.return_value.table.return_value.select.return_value.or_.return_value.execute.return_value = mock_response
+    matching_service.supabase = _StubClient(mock_schemes)
 
     # Test User (Age 25) -> Should match Scheme 1 only
     user = UserProfile(age=25, name="Young User", state="Delhi")
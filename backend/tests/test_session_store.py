@@ -0,0 +1,21 @@
+import pytest
+
+from app.services import session_store
+
+
+@pytest.mark.asyncio
+async def test_in_process_session_roundtrip():
+    session_id = "test-session-store"
+    await session_store.clear_session(session_id)
+
+    await session_store.update_profile(session_id, {"age": 30, "occupation": "farmer"})
+    await session_store.append_chat(session_id, "user", "hello")
+    assert await session_store.get_profile(session_id) == {"age": 30, "occupation": "farmer"}
+    assert await session_store.get_chat_history(session_id) == [{"role": "user", "content": "hello"}]
+
+    for _ in range(session_store.MAX_WARNINGS):
+        warning_num, blocked = await session_store.issue_warning(session_id)
+    assert (warning_num, blocked) == (session_store.MAX_WARNINGS, True)
+    assert (await session_store.is_blocked(session_id))[0] is True
+
+    await session_store.clear_session(session_id)
@@ -0,0 +1,17 @@
+import pytest
+
+from app.services.topic_guard import TopicGuard, TopicVerdict
+
+
+@pytest.mark.parametrize("query", [
+    "what is the score in today's cricket match please",
+    "how much did the movie earn at the box office",
+    "can i get tickets for the cricket world cup match",
+])
+def test_question_openers_do_not_override_off_topic(query):
+    assert TopicGuard().classify(query) == TopicVerdict.WARN
+
+
+def test_multi_word_scheme_keyword_overrides_off_topic():
+    query = "will my e-shram card money arrive before the cricket match"
+    assert TopicGuard().classify(query) == TopicVerdict.ALLOWED
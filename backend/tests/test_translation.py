@@ -0,0 +1,37 @@
+from app.services.translation_service import IndicTransEngine, _TRACE_SAMPLES
+
+
+class _FakeProcessor:
+    """IndicProcessor stand-in: preprocess queues one placeholder map per sentence."""
+
+    def __init__(self):
+        self.queue = []
+
+    def preprocess_batch(self, batch, src_lang, tgt_lang):
+        self.queue.extend({} for _ in batch)
+        return list(batch)
+
+    def postprocess_batch(self, sents, lang):
+        del self.queue[:len(sents)]
+        return list(sents)
+
+
+class _FakeEncoding(dict):
+    def to(self, device):
+        return self
+
+
+def _fake_tokenizer(batch, **kwargs):
+    return _FakeEncoding(input_ids=batch, attention_mask=batch)
+
+
+def test_trace_inputs_leave_no_placeholder_maps_queued():
+    engine = IndicTransEngine()
+    engine._processor = ip = _FakeProcessor()
+
+    inputs = engine._trace_inputs(
+        _fake_tokenizer, "cpu", "eng_Latn", "hin_Deva", _TRACE_SAMPLES["eng_Latn"]
+    )
+
+    assert len(inputs) == len(_TRACE_SAMPLES["eng_Latn"])
+    assert ip.queue == []